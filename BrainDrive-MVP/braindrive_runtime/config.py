@@ -1,20 +1,37 @@
 from __future__ import annotations
 
 import os
+import threading
+from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional, Tuple
 
 from .constants import MODEL_PROVIDER_OLLAMA, MODEL_PROVIDER_OPENROUTER, MODEL_PROVIDERS
+from .protocol import get_dict
 
+try:  # pragma: no cover - depends on optional PyYAML/libyaml install
+    import yaml
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    yaml = None  # type: ignore[assignment]
+    _YamlLoader = None
 
-@dataclass
+_SELECTION_CACHE_SIZE = 128
+
+# Parsed user configs keyed by path -> ((st_mtime_ns, st_size), parsed). Callers get a
+# deep copy, since ConfigResolver.user_config is public and may be mutated.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class ProviderDefaults:
     base_url: str
     default_model: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMSelection:
     provider: str
     model: str
@@ -26,11 +43,28 @@ class ConfigResolver:
     def __init__(self, env: Optional[Mapping[str, str]] = None, user_config_path: Optional[Path] = None) -> None:
         self.env = dict(env or os.environ)
         self.user_config_path = user_config_path or Path.home() / ".braindrive" / "config.yaml"
+        self.reload()
+
+    def reload(self) -> None:
         self.user_config = _load_config_yaml(self.user_config_path)
+        self._llm_cfg = get_dict(self.user_config, "llm")
+        self._default_provider: Optional[Tuple[str, str]] = None
+        self._provider_defaults_cache: Dict[str, ProviderDefaults] = {}
+        self._selection_cache: Dict[Tuple[str, str], LLMSelection] = {}
+        # Inputs to validate_provider_requirements, fixed for the resolver's lifetime.
+        self._openrouter_api_key = self.env.get("BRAINDRIVE_OPENROUTER_API_KEY", "").strip()
+        self._ollama_defaults = self.provider_defaults(MODEL_PROVIDER_OLLAMA)
+
+    def _provider_cfg(self, provider: str) -> Dict[str, Any]:
+        return get_dict(self._llm_cfg, provider)
 
     def default_provider(self) -> Tuple[str, str]:
-        llm_cfg = self.user_config.get("llm", {}) if isinstance(self.user_config.get("llm"), dict) else {}
-        cfg_provider = llm_cfg.get("default_provider")
+        if self._default_provider is None:
+            self._default_provider = self._resolve_default_provider()
+        return self._default_provider
+
+    def _resolve_default_provider(self) -> Tuple[str, str]:
+        cfg_provider = self._llm_cfg.get("default_provider")
         if isinstance(cfg_provider, str) and cfg_provider in MODEL_PROVIDERS:
             return cfg_provider, "user config"
 
@@ -41,8 +75,14 @@ class ConfigResolver:
         return MODEL_PROVIDER_OPENROUTER, "fallback"
 
     def provider_defaults(self, provider: str) -> ProviderDefaults:
-        llm_cfg = self.user_config.get("llm", {}) if isinstance(self.user_config.get("llm"), dict) else {}
-        cfg_provider = llm_cfg.get(provider, {}) if isinstance(llm_cfg.get(provider), dict) else {}
+        cached = self._provider_defaults_cache.get(provider)
+        if cached is None:
+            cached = self._resolve_provider_defaults(provider)
+            self._provider_defaults_cache[provider] = cached
+        return cached
+
+    def _resolve_provider_defaults(self, provider: str) -> ProviderDefaults:
+        cfg_provider = self._provider_cfg(provider)
 
         if provider == MODEL_PROVIDER_OPENROUTER:
             base = str(
@@ -67,23 +107,37 @@ class ConfigResolver:
 
     def select_llm(self, llm_extension: Optional[Dict[str, Any]]) -> LLMSelection:
         ext = llm_extension if isinstance(llm_extension, dict) else {}
-
+        requested_provider = ext.get("provider")
+        if not isinstance(requested_provider, str) or requested_provider not in MODEL_PROVIDERS:
+            requested_provider = ""
+        requested_model = ext.get("model")
+        requested_model = requested_model.strip() if isinstance(requested_model, str) else ""
+
+        # Selections are frozen and depend only on the two overrides, so they are shared.
+        key = (requested_provider, requested_model)
+        selection = self._selection_cache.get(key)
+        if selection is None:
+            if len(self._selection_cache) >= _SELECTION_CACHE_SIZE:
+                self._selection_cache.clear()
+            selection = self._selection_cache[key] = self._resolve_llm(requested_provider, requested_model)
+        return selection
+
+    def _resolve_llm(self, requested_provider: str, requested_model: str) -> LLMSelection:
         provider: str
         provider_source: str
-        if isinstance(ext.get("provider"), str) and ext["provider"] in MODEL_PROVIDERS:
-            provider = ext["provider"]
+        if requested_provider:
+            provider = requested_provider
             provider_source = "request override"
         else:
             provider, provider_source = self.default_provider()
 
         provider_cfg = self.provider_defaults(provider)
 
-        if isinstance(ext.get("model"), str) and ext["model"].strip():
-            model = ext["model"].strip()
+        if requested_model:
+            model = requested_model
             model_source = "request override"
         else:
-            llm_cfg = self.user_config.get("llm", {}) if isinstance(self.user_config.get("llm"), dict) else {}
-            provider_cfg_dict = llm_cfg.get(provider, {}) if isinstance(llm_cfg.get(provider), dict) else {}
+            provider_cfg_dict = self._provider_cfg(provider)
             if isinstance(provider_cfg_dict.get("default_model"), str) and provider_cfg_dict.get("default_model", "").strip():
                 model = provider_cfg_dict["default_model"].strip()
                 model_source = "user config"
@@ -100,13 +154,13 @@ class ConfigResolver:
 
     def validate_provider_requirements(self, selection: LLMSelection) -> Optional[str]:
         if selection.provider == MODEL_PROVIDER_OPENROUTER:
-            if not self.env.get("BRAINDRIVE_OPENROUTER_API_KEY", "").strip():
+            if not self._openrouter_api_key:
                 return "BRAINDRIVE_OPENROUTER_API_KEY is required for provider openrouter"
             if not selection.model:
                 return "Default model is required for provider openrouter"
             return None
 
-        if not self.provider_defaults(MODEL_PROVIDER_OLLAMA).base_url:
+        if not self._ollama_defaults.base_url:
             return "BRAINDRIVE_OLLAMA_BASE_URL is required for provider ollama"
         if not selection.model:
             return "Default model is required for provider ollama"
@@ -120,11 +174,33 @@ class ConfigResolver:
 
 
 def _load_config_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return {}
 
-    raw = path.read_text(encoding="utf-8")
-    parsed = _parse_simple_yaml(raw)
+    key = str(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return deepcopy(cached[1])
+
+    parsed = _parse_config_text(path.read_text(encoding="utf-8"))
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = (stamp, parsed)
+    return deepcopy(parsed)
+
+
+def _parse_config_text(raw: str) -> Dict[str, Any]:
+    parsed: Any
+    if _YamlLoader is not None:
+        try:
+            parsed = yaml.load(raw, Loader=_YamlLoader)
+        except yaml.YAMLError:
+            parsed = _parse_simple_yaml(raw)
+    else:
+        parsed = _parse_simple_yaml(raw)
     return parsed if isinstance(parsed, dict) else {}
 
 
@@ -133,15 +209,18 @@ def _parse_simple_yaml(text: str) -> Dict[str, Any]:
     stack: list[tuple[int, Dict[str, Any]]] = [(-1, root)]
 
     for raw_line in text.splitlines():
-        if not raw_line.strip() or raw_line.lstrip().startswith("#"):
+        # One lstrip/strip per line: the indent comes from the space-stripped
+        # copy and the comment/blank checks reuse the fully stripped one.
+        unindented = raw_line.lstrip(" ")
+        line = unindented.strip()
+        if not line or line[0] == "#":
             continue
-        indent = len(raw_line) - len(raw_line.lstrip(" "))
-        line = raw_line.strip()
-        if ":" not in line:
+        colon = line.find(":")
+        if colon < 0:
             continue
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip()
+        indent = len(raw_line) - len(unindented)
+        key = line[:colon].strip()
+        value = line[colon + 1 :].strip()
 
         while stack and indent <= stack[-1][0]:
             stack.pop()
@@ -153,7 +232,6 @@ def _parse_simple_yaml(text: str) -> Dict[str, Any]:
             stack.append((indent, node))
             continue
 
-        clean_value = value.strip().strip("\"'")
-        parent[key] = clean_value
+        parent[key] = value.strip("\"'")
 
     return root
@@ -18,8 +18,8 @@ E_INTERNAL = "E_INTERNAL"
 RISK_READ = "read"
 RISK_MUTATE = "mutate"
 RISK_DESTRUCTIVE = "destructive"
-RISK_CLASSES = {RISK_READ, RISK_MUTATE, RISK_DESTRUCTIVE}
+RISK_CLASSES = frozenset({RISK_READ, RISK_MUTATE, RISK_DESTRUCTIVE})
 
 MODEL_PROVIDER_OPENROUTER = "openrouter"
 MODEL_PROVIDER_OLLAMA = "ollama"
-MODEL_PROVIDERS = {MODEL_PROVIDER_OPENROUTER, MODEL_PROVIDER_OLLAMA}
+MODEL_PROVIDERS = frozenset({MODEL_PROVIDER_OPENROUTER, MODEL_PROVIDER_OLLAMA})
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, Optional
 
+from .protocol import dumps_json, loads_json
 from .runtime import BrainDriveRuntime
 
+_HEALTH_BODY = dumps_json({"ok": True, "service": "braindrive_runtime.debug"})
+
 
 class DebugIntentServer:
     def __init__(self, runtime: BrainDriveRuntime, host: str = "127.0.0.1", port: int = 9391) -> None:
@@ -13,23 +15,37 @@ class DebugIntentServer:
         self.host = host
         self.port = port
 
-    def serve_forever(self) -> None:
+    def make_server(self) -> ThreadingHTTPServer:
         runtime = self.runtime
 
         class Handler(BaseHTTPRequestHandler):
             server_version = "braindrive_runtime.debug/0.1"
+            # Keep-alive: a client reuses one connection (and one handler
+            # thread) across requests instead of paying a thread per request.
+            protocol_version = "HTTP/1.1"
 
             def _read_json(self) -> Optional[Dict[str, Any]]:
                 try:
                     size = int(self.headers.get("Content-Length", "0"))
-                    raw = self.rfile.read(size)
-                    parsed = json.loads(raw.decode("utf-8"))
+                    # Fill one preallocated buffer instead of letting read()
+                    # join partial chunks into a second copy of the body.
+                    buf = bytearray(size)
+                    view = memoryview(buf)
+                    received = 0
+                    while received < size:
+                        count = self.rfile.readinto(view[received:])
+                        if not count:
+                            return None
+                        received += count
+                    parsed = loads_json(buf)
                 except Exception:
                     return None
                 return parsed if isinstance(parsed, dict) else None
 
             def _send_json(self, code: int, body: Dict[str, Any]) -> None:
-                payload = json.dumps(body, ensure_ascii=True).encode("utf-8")
+                self._send_bytes(code, dumps_json(body))
+
+            def _send_bytes(self, code: int, payload: bytes) -> None:
                 self.send_response(code)
                 self.send_header("Content-Type", "application/json")
                 self.send_header("Content-Length", str(len(payload)))
@@ -38,7 +54,7 @@ class DebugIntentServer:
 
             def do_GET(self) -> None:
                 if self.path == "/health":
-                    self._send_json(200, {"ok": True, "service": "braindrive_runtime.debug"})
+                    self._send_bytes(200, _HEALTH_BODY)
                     return
                 if self.path == "/intent/capabilities":
                     self._send_json(200, runtime.test_endpoint("/intent/capabilities", {}))
@@ -64,5 +80,13 @@ class DebugIntentServer:
                 return
 
         server = ThreadingHTTPServer((self.host, self.port), Handler)
+        server.daemon_threads = True
+        return server
+
+    def serve_forever(self) -> None:
+        server = self.make_server()
         print(f"Debug intent server listening on http://{self.host}:{self.port}")
-        server.serve_forever()
+        try:
+            server.serve_forever()
+        finally:
+            self.runtime.flush()
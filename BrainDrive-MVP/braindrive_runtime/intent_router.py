@@ -2,12 +2,94 @@ from __future__ import annotations
 
 import re
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from .constants import E_NO_ROUTE
-from .protocol import make_error, new_uuid
+from .protocol import get_dict, make_error, new_uuid
 from .router import RouterCore
 
+_TOPIC_RE = re.compile(r"(?:for|about)\s+(.+)$", re.IGNORECASE)
+_FOLDER_TOPIC_RE = re.compile(
+    r"(?:create|new|start)\s+(?:a\s+)?folder(?:\s+(?:called|named|for|about))?\s+(.+)$",
+    re.IGNORECASE,
+)
+_TRAILING_PUNCT_RE = re.compile(r"[.?!]+$")
+_SWITCH_RE = re.compile(r"(?:switch(?:\s+folder)?\s+(?:to\s+)?)|(?:work\s+on\s+)|(?:go\s+to\s+folder\s+)")
+_FOLDER_LIST_RE = re.compile(r"\blist(?:\s+\w+){0,3}\s+folders?\b")
+
+# Keyword groups in routing priority order: when several groups match the
+# same text, the earliest group wins, exactly like the original elif ladder.
+_KEYWORD_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("folder_create", ("create folder", "new folder", "start folder")),
+    ("folder_switch", ("switch folder", "work on", "go to folder")),
+    ("interview_start", ("start interview", "interview me")),
+    ("interview_continue", ("continue interview", "my answer", "answer:")),
+    ("interview_complete", ("complete interview", "finish interview")),
+    ("spec_generate", ("generate spec", "draft spec")),
+    ("spec_propose_save", ("save spec", "propose spec")),
+    ("plan_generate", ("generate plan", "draft plan")),
+    ("plan_propose_save", ("save plan", "propose plan")),
+    ("memory_read", ("read file", "open file")),
+    ("memory_list", ("list files",)),
+    ("memory_search", ("search files", "search notes")),
+    ("memory_write", ("write file", "save file")),
+    ("memory_edit", ("edit file", "update file")),
+    ("memory_delete", ("delete file", "remove file")),
+    ("model_catalog", ("list models", "model catalog")),
+    ("model_complete", ("ask model", "complete with model")),
+    ("model_stream", ("stream model", "stream response")),
+)
+# Flattened (token, group) pairs in priority order, so the first token found
+# in the text names the winning group. Plain substring tests beat a regex
+# alternation of the same literals by several times on CPython.
+_KEYWORD_TOKENS: Tuple[Tuple[str, str], ...] = tuple(
+    (token, name) for name, tokens in _KEYWORD_GROUPS for token in tokens
+)
+# Every keyword (and the folder-list phrasing) contains one of these words;
+# text with none of them skips keyword matching and falls back to model chat.
+_KEYWORD_TRIGGER_RE = re.compile(r"folder|interview|spec|plan|model|file|stream|work on|answer|notes")
+
+
+class _PlanOverlay(NamedTuple):
+    canonical_intent: str
+    confidence: float
+    reason_code: str
+    risk_class: str = "read"
+    required_confirmation: bool = False
+
+
+# Static part of the plan for each keyword group (plus the awaiting-answer
+# context fallback); payloads come from IntentRouterNL._PAYLOAD_BUILDERS.
+_PLAN_OVERLAYS: Dict[str, _PlanOverlay] = {
+    "folder_list": _PlanOverlay("folder.list", 0.96, "keyword_folder_list"),
+    "folder_create": _PlanOverlay("folder.create", 0.95, "keyword_folder_create", "mutate", True),
+    "folder_switch": _PlanOverlay("folder.switch", 0.91, "keyword_folder_switch"),
+    "interview_start": _PlanOverlay("workflow.interview.start", 0.92, "keyword_interview_start"),
+    "interview_continue": _PlanOverlay("workflow.interview.continue", 0.85, "keyword_interview_continue"),
+    "interview_complete": _PlanOverlay("workflow.interview.complete", 0.9, "keyword_interview_complete"),
+    "spec_generate": _PlanOverlay("workflow.spec.generate", 0.9, "keyword_spec_generate"),
+    "spec_propose_save": _PlanOverlay("workflow.spec.propose_save", 0.9, "keyword_spec_propose_save", "mutate"),
+    "plan_generate": _PlanOverlay("workflow.plan.generate", 0.89, "keyword_plan_generate"),
+    "plan_propose_save": _PlanOverlay("workflow.plan.propose_save", 0.89, "keyword_plan_propose_save", "mutate"),
+    "memory_read": _PlanOverlay("memory.read", 0.84, "keyword_memory_read"),
+    "memory_list": _PlanOverlay("memory.list", 0.9, "keyword_memory_list"),
+    "memory_search": _PlanOverlay("memory.search", 0.9, "keyword_memory_search"),
+    "memory_write": _PlanOverlay("memory.write.propose", 0.88, "keyword_memory_write", "mutate", True),
+    "memory_edit": _PlanOverlay("memory.edit.propose", 0.83, "keyword_memory_edit", "mutate", True),
+    "memory_delete": _PlanOverlay("memory.delete.propose", 0.86, "keyword_memory_delete", "destructive", True),
+    "model_catalog": _PlanOverlay("model.catalog.list", 0.93, "keyword_model_catalog"),
+    "model_complete": _PlanOverlay("model.chat.complete", 0.85, "keyword_model_complete"),
+    "model_stream": _PlanOverlay("model.chat.stream", 0.85, "keyword_model_stream"),
+    "interview_answer": _PlanOverlay("workflow.interview.continue", 0.89, "context_interview_awaiting_answer"),
+}
+
+
+def _match_keyword(lower: str) -> Optional[str]:
+    for token, name in _KEYWORD_TOKENS:
+        if token in lower:
+            return name
+    return None
+
 
 class IntentRouterNL:
     def __init__(self, router: RouterCore, confidence_threshold: float = 0.75, catalog_ttl_sec: float = 5.0) -> None:
@@ -15,28 +97,30 @@ class IntentRouterNL:
         self.confidence_threshold = confidence_threshold
         self.catalog_ttl_sec = catalog_ttl_sec
         self._catalog_cached: Dict[str, Any] = {}
+        self._catalog_first_entry: Dict[str, Dict[str, Any]] = {}
         self._catalog_loaded_at = 0.0
+        self._active_folder_cached = ""
+        self._active_folder_loaded_at = 0.0
+        self._active_folder_epoch: Optional[int] = None
 
     def _catalog(self) -> Dict[str, Any]:
         now = time.time()
         if now - self._catalog_loaded_at > self.catalog_ttl_sec:
-            self._catalog_cached = self.router.catalog()
+            catalog = self.router.catalog()
+            self._catalog_cached = catalog
+            self._catalog_first_entry = {
+                capability: entries[0]
+                for capability, entries in catalog.items()
+                if isinstance(entries, list) and entries and isinstance(entries[0], dict)
+            }
             self._catalog_loaded_at = now
         return self._catalog_cached
 
     def _has_capability(self, capability: str) -> bool:
         return capability in self._catalog()
 
-    def _metadata_for(self, capability: str) -> Dict[str, Any]:
-        entries = self._catalog().get(capability, [])
-        if not isinstance(entries, list) or not entries:
-            return {}
-        if not isinstance(entries[0], dict):
-            return {}
-        return entries[0]
-
     def _infer_topic(self, text: str) -> str:
-        match = re.search(r"(?:for|about)\s+(.+)$", text, flags=re.IGNORECASE)
+        match = _TOPIC_RE.search(text)
         if match:
             return match.group(1).strip()
         return text.strip() or "untitled"
@@ -49,15 +133,11 @@ class IntentRouterNL:
             or (value.startswith("'") and value.endswith("'"))
         ):
             value = value[1:-1].strip()
-        value = re.sub(r"[.?!]+$", "", value).strip()
+        value = _TRAILING_PUNCT_RE.sub("", value).strip()
         return value or "untitled"
 
     def _extract_folder_topic(self, text: str) -> str:
-        match = re.search(
-            r"(?:create|new|start)\s+(?:a\s+)?folder(?:\s+(?:called|named|for|about))?\s+(.+)$",
-            text,
-            flags=re.IGNORECASE,
-        )
+        match = _FOLDER_TOPIC_RE.search(text)
         if match:
             return self._clean_label(match.group(1))
         return self._clean_label(self._infer_topic(text))
@@ -79,6 +159,17 @@ class IntentRouterNL:
         if not self._has_capability("folder.list"):
             return ""
 
+        # The probe result is reused only while the router reports no folder create/switch
+        # since it was taken; routers without an epoch (e.g. over HTTP) are probed every time.
+        epoch = getattr(self.router, "active_folder_epoch", None)
+        now = time.time()
+        if (
+            epoch is not None
+            and epoch == self._active_folder_epoch
+            and now - self._active_folder_loaded_at <= self.catalog_ttl_sec
+        ):
+            return self._active_folder_cached
+
         probe_message = {
             "protocol_version": "0.1",
             "message_id": new_uuid(),
@@ -91,35 +182,128 @@ class IntentRouterNL:
             return ""
         if not isinstance(probe, dict):
             return ""
-        payload = probe.get("payload", {})
-        if not isinstance(payload, dict):
+        if probe.get("intent") == "error":
             return ""
-        active = payload.get("active_folder", "")
+        active = get_dict(probe, "payload").get("active_folder", "")
         if not isinstance(active, str):
             return ""
-        return active.strip()
+        self._active_folder_cached = active.strip()
+        self._active_folder_loaded_at = now
+        self._active_folder_epoch = epoch
+        return self._active_folder_cached
 
     @staticmethod
     def _context_awaiting_interview_answer(context: Optional[Dict[str, Any]]) -> bool:
         if not isinstance(context, dict):
             return False
-        interview = context.get("interview", {})
-        if isinstance(interview, dict) and bool(interview.get("awaiting_answer", False)):
+        if bool(get_dict(context, "interview").get("awaiting_answer", False)):
             return True
         return bool(context.get("awaiting_interview_answer", False))
 
+    # Payload builders for keyword groups whose payload depends on the text.
+    # Groups without a builder route with an empty payload.
+
+    def _payload_folder_create(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {"topic": self._extract_folder_topic(cleaned)}
+
+    def _payload_folder_switch(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        folder_match = _SWITCH_RE.search(lower)
+        folder = self._infer_topic(cleaned)
+        if folder_match:
+            start = folder_match.end()
+            candidate = cleaned[start:].strip()
+            if candidate:
+                folder = candidate
+        return {"folder": folder.replace(" ", "-").lower()}
+
+    def _payload_interview_continue(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        _head, sep, tail = cleaned.partition(":")
+        return {"answer": tail.strip() if sep else cleaned}
+
+    def _payload_memory_read(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {"path": self._infer_topic(cleaned)}
+
+    def _payload_memory_list(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        active_folder = self._resolve_active_folder(context)
+        plan["reason_codes"].append("active_folder_scope" if active_folder else "library_root_scope")
+        return {"path": active_folder or "."}
+
+    def _payload_memory_search(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {"query": self._infer_topic(cleaned)}
+
+    def _payload_notes_content(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {"path": "notes.md", "content": cleaned}
+
+    def _payload_notes_path(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {"path": "notes.md"}
+
+    def _payload_model_complete(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        _head, sep, tail = cleaned.partition("model")
+        prompt = tail.strip() if sep else cleaned
+        return {"prompt": prompt or cleaned}
+
+    def _payload_prompt(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {"prompt": cleaned}
+
+    def _payload_answer(
+        self, plan: Dict[str, Any], cleaned: str, lower: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {"answer": cleaned}
+
+    _PAYLOAD_BUILDERS: Dict[
+        str, Callable[["IntentRouterNL", Dict[str, Any], str, str, Optional[Dict[str, Any]]], Dict[str, Any]]
+    ] = {
+        "folder_create": _payload_folder_create,
+        "folder_switch": _payload_folder_switch,
+        "interview_continue": _payload_interview_continue,
+        "memory_read": _payload_memory_read,
+        "memory_list": _payload_memory_list,
+        "memory_search": _payload_memory_search,
+        "memory_write": _payload_notes_content,
+        "memory_edit": _payload_notes_content,
+        "memory_delete": _payload_notes_path,
+        "model_complete": _payload_model_complete,
+        "model_stream": _payload_prompt,
+        "interview_answer": _payload_answer,
+    }
+
     def _analyze_intent(self, text: str, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         cleaned = text.strip()
         lower = cleaned.lower()
+        # Built directly in the analyze() output layout; keyword overlays only
+        # replace values, so key order matches the published analysis shape.
         plan: Dict[str, Any] = {
             "canonical_intent": "model.chat.complete",
             "confidence": 0.86,
             "risk_class": "read",
             "reason_codes": ["fallback_model_chat"],
             "required_extensions": [],
-            "payload": {"prompt": cleaned},
+            "target_capabilities": None,
             "clarification_required": False,
+            "clarification_prompt": "",
+            "payload": {"prompt": cleaned},
             "required_confirmation": False,
+            "error_code": None,
         }
 
         if not cleaned:
@@ -127,244 +311,41 @@ class IntentRouterNL:
             plan["clarification_required"] = True
             plan["reason_codes"] = ["empty_prompt"]
             plan["clarification_prompt"] = "Please share what you want to do."
+            plan["target_capabilities"] = [plan["canonical_intent"]]
             return plan
 
-        if re.search(r"\blist(?:\s+\w+){0,3}\s+folders?\b", lower) or lower in {"folders", "list folder"}:
-            plan.update(
-                {
-                    "canonical_intent": "folder.list",
-                    "confidence": 0.96,
-                    "reason_codes": ["keyword_folder_list"],
-                    "payload": {},
-                }
-            )
-
-        elif any(token in lower for token in ["create folder", "new folder", "start folder"]):
-            topic = self._extract_folder_topic(cleaned)
-            plan.update(
-                {
-                    "canonical_intent": "folder.create",
-                    "confidence": 0.95,
-                    "risk_class": "mutate",
-                    "required_confirmation": True,
-                    "reason_codes": ["keyword_folder_create"],
-                    "payload": {"topic": topic},
-                }
-            )
-
-        elif any(token in lower for token in ["switch folder", "work on", "go to folder"]):
-            folder_match = re.search(r"(?:switch(?:\s+folder)?\s+(?:to\s+)?)|(?:work\s+on\s+)|(?:go\s+to\s+folder\s+)", lower)
-            folder = self._infer_topic(cleaned)
-            if folder_match:
-                start = folder_match.end()
-                candidate = cleaned[start:].strip()
-                if candidate:
-                    folder = candidate
-            plan.update(
-                {
-                    "canonical_intent": "folder.switch",
-                    "confidence": 0.91,
-                    "reason_codes": ["keyword_folder_switch"],
-                    "payload": {"folder": folder.replace(" ", "-").lower()},
-                }
-            )
-
-        elif any(token in lower for token in ["start interview", "interview me"]):
-            plan.update(
-                {
-                    "canonical_intent": "workflow.interview.start",
-                    "confidence": 0.92,
-                    "reason_codes": ["keyword_interview_start"],
-                    "payload": {},
-                }
-            )
-
-        elif any(token in lower for token in ["continue interview", "my answer", "answer:"]):
-            answer = cleaned.split(":", 1)[1].strip() if ":" in cleaned else cleaned
-            plan.update(
-                {
-                    "canonical_intent": "workflow.interview.continue",
-                    "confidence": 0.85,
-                    "reason_codes": ["keyword_interview_continue"],
-                    "payload": {"answer": answer},
-                }
-            )
-
-        elif any(token in lower for token in ["complete interview", "finish interview"]):
-            plan.update(
-                {
-                    "canonical_intent": "workflow.interview.complete",
-                    "confidence": 0.9,
-                    "reason_codes": ["keyword_interview_complete"],
-                    "payload": {},
-                }
-            )
-
-        elif any(token in lower for token in ["generate spec", "draft spec"]):
-            plan.update(
-                {
-                    "canonical_intent": "workflow.spec.generate",
-                    "confidence": 0.9,
-                    "reason_codes": ["keyword_spec_generate"],
-                    "payload": {},
-                }
-            )
-
-        elif any(token in lower for token in ["save spec", "propose spec"]):
-            plan.update(
-                {
-                    "canonical_intent": "workflow.spec.propose_save",
-                    "confidence": 0.9,
-                    "risk_class": "mutate",
-                    "required_confirmation": False,
-                    "reason_codes": ["keyword_spec_propose_save"],
-                    "payload": {},
-                }
-            )
-
-        elif any(token in lower for token in ["generate plan", "draft plan"]):
-            plan.update(
-                {
-                    "canonical_intent": "workflow.plan.generate",
-                    "confidence": 0.89,
-                    "reason_codes": ["keyword_plan_generate"],
-                    "payload": {},
-                }
-            )
-
-        elif any(token in lower for token in ["save plan", "propose plan"]):
-            plan.update(
-                {
-                    "canonical_intent": "workflow.plan.propose_save",
-                    "confidence": 0.89,
-                    "risk_class": "mutate",
-                    "reason_codes": ["keyword_plan_propose_save"],
-                    "payload": {},
-                }
-            )
-
-        elif any(token in lower for token in ["read file", "open file"]):
-            path = self._infer_topic(cleaned)
-            plan.update(
-                {
-                    "canonical_intent": "memory.read",
-                    "confidence": 0.84,
-                    "reason_codes": ["keyword_memory_read"],
-                    "payload": {"path": path},
-                }
-            )
-
-        elif "list files" in lower:
-            active_folder = self._resolve_active_folder(context)
-            list_path = active_folder or "."
-            reason_codes = ["keyword_memory_list"]
-            reason_codes.append("active_folder_scope" if active_folder else "library_root_scope")
-            plan.update(
-                {
-                    "canonical_intent": "memory.list",
-                    "confidence": 0.9,
-                    "reason_codes": reason_codes,
-                    "payload": {"path": list_path},
-                }
-            )
-
-        elif any(token in lower for token in ["search files", "search notes"]):
-            query = self._infer_topic(cleaned)
-            plan.update(
-                {
-                    "canonical_intent": "memory.search",
-                    "confidence": 0.9,
-                    "reason_codes": ["keyword_memory_search"],
-                    "payload": {"query": query},
-                }
-            )
-
-        elif any(token in lower for token in ["write file", "save file"]):
-            plan.update(
-                {
-                    "canonical_intent": "memory.write.propose",
-                    "confidence": 0.88,
-                    "risk_class": "mutate",
-                    "required_confirmation": True,
-                    "reason_codes": ["keyword_memory_write"],
-                    "payload": {"path": "notes.md", "content": cleaned},
-                }
-            )
-
-        elif any(token in lower for token in ["edit file", "update file"]):
-            plan.update(
-                {
-                    "canonical_intent": "memory.edit.propose",
-                    "confidence": 0.83,
-                    "risk_class": "mutate",
-                    "required_confirmation": True,
-                    "reason_codes": ["keyword_memory_edit"],
-                    "payload": {"path": "notes.md", "content": cleaned},
-                }
-            )
-
-        elif any(token in lower for token in ["delete file", "remove file"]):
-            plan.update(
-                {
-                    "canonical_intent": "memory.delete.propose",
-                    "confidence": 0.86,
-                    "risk_class": "destructive",
-                    "required_confirmation": True,
-                    "reason_codes": ["keyword_memory_delete"],
-                    "payload": {"path": "notes.md"},
-                }
-            )
-
-        elif any(token in lower for token in ["list models", "model catalog"]):
-            plan.update(
-                {
-                    "canonical_intent": "model.catalog.list",
-                    "confidence": 0.93,
-                    "reason_codes": ["keyword_model_catalog"],
-                    "payload": {},
-                }
-            )
-
-        elif any(token in lower for token in ["ask model", "complete with model"]):
-            prompt = cleaned.split("model", 1)[-1].strip() if "model" in cleaned else cleaned
-            plan.update(
-                {
-                    "canonical_intent": "model.chat.complete",
-                    "confidence": 0.85,
-                    "reason_codes": ["keyword_model_complete"],
-                    "payload": {"prompt": prompt or cleaned},
-                }
-            )
-
-        elif any(token in lower for token in ["stream model", "stream response"]):
-            plan.update(
-                {
-                    "canonical_intent": "model.chat.stream",
-                    "confidence": 0.85,
-                    "reason_codes": ["keyword_model_stream"],
-                    "payload": {"prompt": cleaned},
-                }
-            )
-
-        elif self._context_awaiting_interview_answer(context):
-            plan.update(
-                {
-                    "canonical_intent": "workflow.interview.continue",
-                    "confidence": 0.89,
-                    "reason_codes": ["context_interview_awaiting_answer"],
-                    "payload": {"answer": cleaned},
-                }
-            )
-
-        metadata = self._metadata_for(plan["canonical_intent"])
+        catalog = self._catalog()
+        first_entries = self._catalog_first_entry
+
+        keyword: Optional[str]
+        if _KEYWORD_TRIGGER_RE.search(lower) is None:
+            keyword = None
+        elif _FOLDER_LIST_RE.search(lower) or lower in {"folders", "list folder"}:
+            keyword = "folder_list"
+        else:
+            keyword = _match_keyword(lower)
+        if keyword is None and self._context_awaiting_interview_answer(context):
+            keyword = "interview_answer"
+
+        if keyword is not None:
+            overlay = _PLAN_OVERLAYS[keyword]
+            plan["canonical_intent"] = overlay.canonical_intent
+            plan["confidence"] = overlay.confidence
+            plan["risk_class"] = overlay.risk_class
+            plan["reason_codes"] = [overlay.reason_code]
+            plan["required_confirmation"] = overlay.required_confirmation
+            build_payload = self._PAYLOAD_BUILDERS.get(keyword)
+            plan["payload"] = build_payload(self, plan, cleaned, lower, context) if build_payload else {}
+
+        intent = plan["canonical_intent"]
+        plan["target_capabilities"] = [intent]
+        metadata = first_entries.get(intent)
         if metadata:
             plan["risk_class"] = metadata.get("risk_class", plan["risk_class"])
             plan["required_extensions"] = metadata.get("required_extensions", [])
             plan["required_confirmation"] = bool(metadata.get("approval_required", plan["required_confirmation"]))
-        else:
-            plan["required_extensions"] = []
 
-        if not self._has_capability(plan["canonical_intent"]):
+        if intent not in catalog:
             plan["clarification_required"] = True
             plan["error_code"] = E_NO_ROUTE
             plan["reason_codes"].append("capability_unavailable")
@@ -373,25 +354,13 @@ class IntentRouterNL:
         if float(plan["confidence"]) < self.confidence_threshold:
             plan["clarification_required"] = True
             plan["reason_codes"].append("confidence_below_threshold")
-            plan.setdefault("clarification_prompt", "I need clarification before routing this request.")
+            if not plan["clarification_prompt"]:
+                plan["clarification_prompt"] = "I need clarification before routing this request."
 
         return plan
 
     def analyze(self, text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        plan = self._analyze_intent(text, context)
-        return {
-            "canonical_intent": plan["canonical_intent"],
-            "confidence": plan["confidence"],
-            "risk_class": plan["risk_class"],
-            "reason_codes": plan["reason_codes"],
-            "required_extensions": plan["required_extensions"],
-            "target_capabilities": [plan["canonical_intent"]],
-            "clarification_required": plan["clarification_required"],
-            "clarification_prompt": plan.get("clarification_prompt", ""),
-            "payload": plan["payload"],
-            "required_confirmation": plan.get("required_confirmation", False),
-            "error_code": plan.get("error_code"),
-        }
+        return self._analyze_intent(text, context)
 
     def route(
         self,
@@ -424,7 +393,7 @@ class IntentRouterNL:
             extensions["confirmation"] = {
                 "required": True,
                 "status": "approved" if confirm else "pending",
-                "request_id": str(new_uuid()),
+                "request_id": new_uuid(),
             }
 
         message = {
@@ -459,19 +428,19 @@ class IntentRouterNL:
 
     def analyze_endpoint(self, message: Dict[str, Any]) -> Dict[str, Any]:
         text = str(message.get("message", ""))
-        context = message.get("context", {}) if isinstance(message.get("context"), dict) else None
+        context = get_dict(message, "context")
         return {"ok": True, "analysis": self.analyze(text, context=context)}
 
     def route_endpoint(self, message: Dict[str, Any]) -> Dict[str, Any]:
         text = str(message.get("message", ""))
         confirm = bool(message.get("confirm", False))
-        context = message.get("context", {}) if isinstance(message.get("context"), dict) else None
-        request_extensions = message.get("extensions", {}) if isinstance(message.get("extensions"), dict) else {}
+        context = get_dict(message, "context")
+        request_extensions = get_dict(message, "extensions")
         return self.route(text, context=context, confirm=confirm, request_extensions=request_extensions)
 
     def bdp_handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
         intent = message.get("intent")
-        payload = message.get("payload", {}) if isinstance(message.get("payload", {}), dict) else {}
+        payload = get_dict(message, "payload")
         if intent == "intent.router.build_plan":
             text = str(payload.get("message", ""))
             return {
@@ -1,25 +1,22 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 from .constants import MODEL_PROVIDERS, RISK_CLASSES
 
+_IDEMPOTENCY = frozenset({"idempotent", "non_idempotent"})
+_SIDE_EFFECT_SCOPES = frozenset({"none", "file", "external"})
+
 
 def parse_version(version: str) -> Tuple[int, int, int]:
-    parts = version.split(".")
-    values: List[int] = []
-    for token in parts[:3]:
-        try:
-            values.append(int(token))
-        except ValueError:
-            values.append(0)
-    while len(values) < 3:
-        values.append(0)
+    values = [int(token) if token.isdecimal() else 0 for token in version.split(".", 3)[:3]]
+    values.extend([0] * (3 - len(values)))
     return values[0], values[1], values[2]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CapabilityMetadata:
     name: str
     description: str
@@ -44,23 +41,24 @@ class CapabilityMetadata:
             return f"capability {self.name} required_extensions must be list[str]"
         if not isinstance(self.examples, list) or not self.examples or not all(isinstance(v, str) for v in self.examples):
             return f"capability {self.name} examples must contain at least one string"
-        if self.idempotency not in {"idempotent", "non_idempotent"}:
+        if self.idempotency not in _IDEMPOTENCY:
             return f"capability {self.name} invalid idempotency"
-        if self.side_effect_scope not in {"none", "file", "external"}:
+        if self.side_effect_scope not in _SIDE_EFFECT_SCOPES:
             return f"capability {self.name} invalid side_effect_scope"
         if self.provider is not None and self.provider not in MODEL_PROVIDERS:
             return f"capability {self.name} invalid provider"
         return None
 
     def to_dict(self) -> Dict[str, Any]:
+        # Lists and dicts are shared with the instance, not copied; callers serialize them.
         return {
             "name": self.name,
             "description": self.description,
             "input_schema": self.input_schema,
             "risk_class": self.risk_class,
-            "required_extensions": list(self.required_extensions),
+            "required_extensions": self.required_extensions,
             "approval_required": bool(self.approval_required),
-            "examples": list(self.examples),
+            "examples": self.examples,
             "idempotency": self.idempotency,
             "side_effect_scope": self.side_effect_scope,
             "capability_version": self.capability_version,
@@ -70,22 +68,17 @@ class CapabilityMetadata:
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "CapabilityMetadata":
         raw_provider = payload.get("provider")
-        provider: Optional[str]
-        if raw_provider is None:
-            provider = None
-        elif isinstance(raw_provider, str):
-            provider = raw_provider.strip() or None
-        else:
-            provider = None
+        provider = (raw_provider.strip() or None) if isinstance(raw_provider, str) else None
+        input_schema = payload.get("input_schema", {})
 
         return cls(
-            name=str(payload.get("name", "")).strip(),
+            name=sys.intern(str(payload.get("name", "")).strip()),
             description=str(payload.get("description", "")).strip(),
-            input_schema=payload.get("input_schema", {}) if isinstance(payload.get("input_schema", {}), dict) else {},
+            input_schema=input_schema if isinstance(input_schema, dict) else {},
             risk_class=str(payload.get("risk_class", "")).strip(),
-            required_extensions=[str(v) for v in payload.get("required_extensions", []) if isinstance(v, str)],
+            required_extensions=[v for v in payload.get("required_extensions", []) if isinstance(v, str)],
             approval_required=bool(payload.get("approval_required", False)),
-            examples=[str(v) for v in payload.get("examples", []) if isinstance(v, str)],
+            examples=[v for v in payload.get("examples", []) if isinstance(v, str)],
             idempotency=str(payload.get("idempotency", "")).strip(),
             side_effect_scope=str(payload.get("side_effect_scope", "")).strip(),
             capability_version=str(payload.get("capability_version", "")).strip(),
@@ -93,7 +86,7 @@ class CapabilityMetadata:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeDescriptor:
     node_id: str
     node_version: str
@@ -128,15 +121,16 @@ class NodeDescriptor:
         return None
 
     def to_dict(self) -> Dict[str, Any]:
+        # Shares nested containers with the instance, like CapabilityMetadata.to_dict.
         return {
             "node_id": self.node_id,
             "node_version": self.node_version,
             "endpoint_url": self.endpoint_url,
-            "supported_protocol_versions": list(self.supported_protocol_versions),
+            "supported_protocol_versions": self.supported_protocol_versions,
             "capabilities": [cap.to_dict() for cap in self.capabilities],
-            "requires": list(self.requires),
+            "requires": self.requires,
             "priority": int(self.priority),
-            "auth": dict(self.auth),
+            "auth": self.auth,
         }
 
     @classmethod
@@ -144,18 +138,15 @@ class NodeDescriptor:
         capabilities_raw = payload.get("capabilities", [])
         capabilities: List[CapabilityMetadata] = []
         if isinstance(capabilities_raw, list):
-            for item in capabilities_raw:
-                if isinstance(item, dict):
-                    capabilities.append(CapabilityMetadata.from_dict(item))
+            capabilities = [CapabilityMetadata.from_dict(item) for item in capabilities_raw if isinstance(item, dict)]
+        auth = payload.get("auth", {})
         return cls(
             node_id=str(payload.get("node_id", "")).strip(),
             node_version=str(payload.get("node_version", "")).strip(),
             endpoint_url=str(payload.get("endpoint_url", "")).strip(),
-            supported_protocol_versions=[
-                str(v) for v in payload.get("supported_protocol_versions", []) if isinstance(v, str)
-            ],
+            supported_protocol_versions=[v for v in payload.get("supported_protocol_versions", []) if isinstance(v, str)],
             capabilities=capabilities,
-            requires=[str(v) for v in payload.get("requires", []) if isinstance(v, str)],
+            requires=[v for v in payload.get("requires", []) if isinstance(v, str)],
             priority=int(payload.get("priority", 100)),
-            auth=payload.get("auth", {}) if isinstance(payload.get("auth", {}), dict) else {},
+            auth=auth if isinstance(auth, dict) else {},
         )
@@ -1,11 +1,46 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any, Dict, List
+import threading
+from typing import Any, Dict, List, Tuple
 
-from ..protocol import make_error, make_response, new_uuid, now_iso
+from ..metadata import CapabilityMetadata
+from ..protocol import make_error, make_response, new_uuid, normalize_message, now_iso
 from .base import ProtocolNode, cap
 
+_DECISIONS = frozenset({"approved", "denied"})
+# A long-lived node folds its journal into the snapshot after this many appends, so
+# neither the file nor the next start's replay grows with the full request history.
+_JOURNAL_COMPACT_EVERY = 256
+
+_CAPABILITIES = (
+    cap(
+        name="approval.request",
+        description="Create approval request for pending mutation",
+        input_schema={"type": "object", "required": ["intent_being_guarded", "changes"]},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["request approval for spec save"],
+        idempotency="non_idempotent",
+        side_effect_scope="file",
+    ),
+    cap(
+        name="approval.resolve",
+        description="Resolve approval request",
+        input_schema={"type": "object", "required": ["request_id", "decision"]},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["approve request appr-123"],
+        idempotency="non_idempotent",
+        side_effect_scope="file",
+    ),
+)
+
+
+def _copy_changes(changes: List[Any]) -> List[Any]:
+    return [dict(item) if isinstance(item, dict) else item for item in changes]
+
 
 class ApprovalGateNode(ProtocolNode):
     node_id = "node.approval.gate"
@@ -17,35 +52,43 @@ class ApprovalGateNode(ProtocolNode):
         self.state: Dict[str, Any] = loaded if isinstance(loaded, dict) else {"requests": {}}
         if not isinstance(self.state.get("requests"), dict):
             self.state["requests"] = {}
-
-    def capabilities(self) -> List:
-        return [
-            cap(
-                name="approval.request",
-                description="Create approval request for pending mutation",
-                input_schema={"type": "object", "required": ["intent_being_guarded", "changes"]},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["request approval for spec save"],
-                idempotency="non_idempotent",
-                side_effect_scope="file",
-            ),
-            cap(
-                name="approval.resolve",
-                description="Resolve approval request",
-                input_schema={"type": "object", "required": ["request_id", "decision"]},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["approve request appr-123"],
-                idempotency="non_idempotent",
-                side_effect_scope="file",
-            ),
-        ]
-
-    def _save(self) -> None:
-        self.ctx.persistence.save_state("approvals", self.state)
+        # Held per message so a compaction snapshot never sees a half-applied request.
+        self._lock = threading.Lock()
+        self._journal_entries = 0
+        self._replay_journal()
+        self._dispatch = {
+            "approval.request": self._handle_request,
+            "approval.resolve": self._handle_resolve,
+        }
+
+    def capabilities(self) -> Tuple[CapabilityMetadata, ...]:
+        return _CAPABILITIES
+
+    def _replay_journal(self) -> None:
+        entries = self.ctx.persistence.load_journal("approvals")
+        if not entries:
+            return
+        requests = self.state["requests"]
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            op = entry.get("op")
+            if op == "request" and isinstance(entry.get("record"), dict):
+                record = entry["record"]
+                requests[str(record.get("request_id", ""))] = record
+            elif op == "resolve" and isinstance(entry.get("fields"), dict):
+                record = self._get_request(str(entry.get("request_id", "")))
+                if record is not None:
+                    record.update(entry["fields"])
+        # Fold the replayed journal into the snapshot so the next start reads one file.
+        self.ctx.persistence.compact_journal("approvals", self.state)
+
+    def _journal(self, entry: Dict[str, Any]) -> None:
+        self.ctx.persistence.append_journal("approvals", entry)
+        self._journal_entries += 1
+        if self._journal_entries >= _JOURNAL_COMPACT_EVERY:
+            self.ctx.persistence.compact_journal("approvals", self.state)
+            self._journal_entries = 0
 
     def _get_request(self, request_id: str) -> Dict[str, Any] | None:
         requests = self.state.get("requests", {})
@@ -54,75 +97,77 @@ class ApprovalGateNode(ProtocolNode):
         item = requests.get(request_id)
         return item if isinstance(item, dict) else None
 
-    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        intent = message.get("intent")
-        payload = message.get("payload", {})
-
-        if intent == "approval.request":
-            if not isinstance(payload, dict):
-                return make_error("E_BAD_MESSAGE", "payload must be object", message.get("message_id"))
-
-            guarded = str(payload.get("intent_being_guarded", "")).strip()
-            changes = payload.get("changes", [])
-            if not guarded:
-                return make_error("E_BAD_MESSAGE", "intent_being_guarded is required", message.get("message_id"))
-            if not isinstance(changes, list) or not changes:
-                return make_error("E_BAD_MESSAGE", "changes must be non-empty list", message.get("message_id"))
-
-            request_id = str(payload.get("request_id", "")).strip() or f"appr-{new_uuid()}"
-            record = {
-                "request_id": request_id,
-                "intent_being_guarded": guarded,
-                "changes": deepcopy(changes),
-                "status": "pending",
-                "requested_at": now_iso(),
-                "resolved_at": None,
-                "decision": None,
-                "decision_note": "",
-            }
-
-            self.state.setdefault("requests", {})[request_id] = record
-            self._save()
-
-            return make_response(
-                "approval.requested",
-                deepcopy(record),
-                message.get("message_id"),
-            )
-
-        if intent == "approval.resolve":
-            if not isinstance(payload, dict):
-                return make_error("E_BAD_MESSAGE", "payload must be object", message.get("message_id"))
-
-            request_id = str(payload.get("request_id", "")).strip()
-            decision = str(payload.get("decision", "")).strip().lower()
-            if not request_id:
-                return make_error("E_BAD_MESSAGE", "request_id is required", message.get("message_id"))
-            if decision not in {"approved", "denied"}:
-                return make_error("E_BAD_MESSAGE", "decision must be approved|denied", message.get("message_id"))
-
-            record = self._get_request(request_id)
-            if not record:
-                return make_error("E_NO_ROUTE", f"approval request not found: {request_id}", message.get("message_id"))
-
-            record["status"] = decision
-            record["decision"] = decision
-            record["resolved_at"] = now_iso()
-            record["decision_note"] = str(payload.get("decision_note", ""))
-            record["decided_by"] = str(payload.get("decided_by", "owner"))
-            self._save()
-
-            return make_response(
-                "approval.resolved",
-                {
-                    **deepcopy(record),
-                    "confirmation": {
-                        "required": True,
-                        "status": decision,
-                        "request_id": request_id,
-                    },
+    def _handle_request(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        guarded = str(payload.get("intent_being_guarded", "")).strip()
+        changes = payload.get("changes", [])
+        if not guarded:
+            return make_error("E_BAD_MESSAGE", "intent_being_guarded is required", message_id)
+        if not isinstance(changes, list) or not changes:
+            return make_error("E_BAD_MESSAGE", "changes must be non-empty list", message_id)
+
+        request_id = str(payload.get("request_id", "")).strip() or f"appr-{new_uuid()}"
+        record = {
+            "request_id": request_id,
+            "intent_being_guarded": guarded,
+            "changes": _copy_changes(changes),
+            "status": "pending",
+            "requested_at": now_iso(),
+            "resolved_at": None,
+            "decision": None,
+            "decision_note": "",
+        }
+
+        self.state["requests"][request_id] = record
+        self._journal({"op": "request", "record": record})
+
+        return make_response(
+            "approval.requested",
+            {**record, "changes": _copy_changes(record["changes"])},
+            message_id,
+        )
+
+    def _handle_resolve(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        request_id = str(payload.get("request_id", "")).strip()
+        decision = str(payload.get("decision", "")).strip().lower()
+        if not request_id:
+            return make_error("E_BAD_MESSAGE", "request_id is required", message_id)
+        if decision not in _DECISIONS:
+            return make_error("E_BAD_MESSAGE", "decision must be approved|denied", message_id)
+
+        record = self._get_request(request_id)
+        if not record:
+            return make_error("E_NO_ROUTE", f"approval request not found: {request_id}", message_id)
+
+        fields = {
+            "status": decision,
+            "decision": decision,
+            "resolved_at": now_iso(),
+            "decision_note": str(payload.get("decision_note", "")),
+            "decided_by": str(payload.get("decided_by", "owner")),
+        }
+        record.update(fields)
+        self._journal({"op": "resolve", "request_id": request_id, "fields": fields})
+
+        return make_response(
+            "approval.resolved",
+            {
+                **record,
+                "changes": _copy_changes(record.get("changes", [])),
+                "confirmation": {
+                    "required": True,
+                    "status": decision,
+                    "request_id": request_id,
                 },
-                message.get("message_id"),
-            )
+            },
+            message_id,
+        )
 
-        return make_error("E_NO_ROUTE", "Unsupported intent", message.get("message_id"))
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        intent, payload, message_id = normalize_message(message)
+        handler = self._dispatch.get(intent)
+        if handler is None:
+            return make_error("E_NO_ROUTE", "Unsupported intent", message_id)
+        if payload is None:
+            return make_error("E_BAD_MESSAGE", "payload must be object", message_id)
+        with self._lock:
+            return handler(message, payload, message_id)
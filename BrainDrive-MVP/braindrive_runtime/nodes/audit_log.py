@@ -1,34 +1,58 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
 
-from ..protocol import make_error, make_response
+from ..metadata import CapabilityMetadata
+from ..protocol import make_error, make_response, normalize_message, now_iso
 from .base import ProtocolNode, cap
 
+_CAPABILITIES = (
+    cap(
+        name="audit.record",
+        description="Append auditable event record",
+        input_schema={"type": "object"},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["record audit event"],
+        idempotency="idempotent",
+        side_effect_scope="none",
+    ),
+)
+
 
 class AuditLogNode(ProtocolNode):
     node_id = "node.audit.log"
     priority = 50
 
-    def capabilities(self) -> List:
-        return [
-            cap(
-                name="audit.record",
-                description="Append auditable event record",
-                input_schema={"type": "object"},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["record audit event"],
-                idempotency="idempotent",
-                side_effect_scope="none",
-            )
-        ]
+    def __init__(self, ctx) -> None:
+        super().__init__(ctx)
+        self._pending: Deque[Tuple[str, str, Dict[str, Any]]] = deque()
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def capabilities(self) -> Tuple[CapabilityMetadata, ...]:
+        return _CAPABILITIES
+
+    def _record(self, payload: Dict[str, Any]) -> None:
+        # Group commit: whoever holds the write lock appends every queued event in one write.
+        # A caller returns only once its own event is on disk, either written by itself or
+        # by the holder it waited behind, so a reply is never sent for an unwritten record.
+        with self._pending_lock:
+            self._pending.append((now_iso(), "audit.record", payload))
+        with self._write_lock:
+            with self._pending_lock:
+                events = list(self._pending)
+                self._pending.clear()
+            if events:
+                self.ctx.persistence.emit_events("audit", events)
 
     def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        if message.get("intent") != "audit.record":
-            return make_error("E_NO_ROUTE", "Unsupported intent", message.get("message_id"))
+        intent, payload, message_id = normalize_message(message)
+        if intent != "audit.record":
+            return make_error("E_NO_ROUTE", "Unsupported intent", message_id)
 
-        payload = message.get("payload", {})
-        self.ctx.persistence.emit_event("audit", "audit.record", payload if isinstance(payload, dict) else {"value": payload})
-        return make_response("audit.recorded", {"ok": True}, message.get("message_id"))
+        self._record(payload if payload is not None else {"value": message.get("payload")})
+        return make_response("audit.recorded", {"ok": True}, message_id)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Mapping, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..state import WorkflowState
@@ -11,6 +13,19 @@ from ..constants import PROTOCOL_VERSION
 from ..metadata import CapabilityMetadata, NodeDescriptor
 from ..persistence import Persistence
 
+_LIBRARY_LOCKS: Dict[Path, Any] = {}
+_LIBRARY_LOCKS_GUARD = threading.Lock()
+
+
+def library_lock(library_root: Path) -> Any:
+    # One re-entrant lock per resolved library root, shared by every node that mutates it.
+    root = library_root.resolve()
+    with _LIBRARY_LOCKS_GUARD:
+        lock = _LIBRARY_LOCKS.get(root)
+        if lock is None:
+            lock = _LIBRARY_LOCKS[root] = threading.RLock()
+    return lock
+
 
 @dataclass
 class NodeContext:
@@ -29,25 +44,31 @@ class ProtocolNode:
 
     def __init__(self, ctx: NodeContext) -> None:
         self.ctx = ctx
+        self._descriptor: NodeDescriptor | None = None
 
-    def capabilities(self) -> List[CapabilityMetadata]:
+    def capabilities(self) -> Sequence[CapabilityMetadata]:
         raise NotImplementedError
 
     def descriptor(self) -> NodeDescriptor:
-        return NodeDescriptor(
-            node_id=self.node_id,
-            node_version=self.node_version,
-            endpoint_url=f"inproc://{self.node_id}",
-            supported_protocol_versions=[PROTOCOL_VERSION],
-            capabilities=self.capabilities(),
-            requires=[],
-            priority=self.priority,
-            auth={"registration_token": self.ctx.registration_token},
-        )
+        if self._descriptor is None:
+            self._descriptor = NodeDescriptor(
+                node_id=self.node_id,
+                node_version=self.node_version,
+                endpoint_url=f"inproc://{self.node_id}",
+                supported_protocol_versions=[PROTOCOL_VERSION],
+                capabilities=list(self.capabilities()),
+                requires=[],
+                priority=self.priority,
+                auth={"registration_token": self.ctx.registration_token},
+            )
+        return self._descriptor
 
     def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
         raise NotImplementedError
 
+    def flush(self) -> None:
+        return None
+
 
 def cap(
     name: str,
@@ -63,7 +84,7 @@ def cap(
     provider: str | None = None,
 ) -> CapabilityMetadata:
     return CapabilityMetadata(
-        name=name,
+        name=sys.intern(name),
         description=description,
         input_schema=input_schema,
         risk_class=risk_class,
@@ -1,81 +1,109 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import stat
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
-from ..protocol import make_error, make_response
+from ..metadata import CapabilityMetadata
+from ..protocol import make_error, make_response, normalize_message
 from .base import ProtocolNode, cap
 
+_CAPABILITIES = (
+    cap(
+        name="chat.general",
+        description="General chat response",
+        input_schema={"type": "object", "required": ["text"]},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["chat about my goals"],
+        idempotency="idempotent",
+        side_effect_scope="none",
+    ),
+    cap(
+        name="runtime.cancel_generation",
+        description="Cancel active generation",
+        input_schema={"type": "object"},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["stop generating"],
+        idempotency="idempotent",
+        side_effect_scope="none",
+    ),
+    cap(
+        name="runtime.compact_context",
+        description="Compact current context when token budget is high",
+        input_schema={"type": "object"},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["compact context"],
+        idempotency="idempotent",
+        side_effect_scope="none",
+    ),
+)
+
 
 class ChatGeneralNode(ProtocolNode):
     node_id = "interface.cli"
     priority = 100
 
-    def capabilities(self) -> List:
-        return [
-            cap(
-                name="chat.general",
-                description="General chat response",
-                input_schema={"type": "object", "required": ["text"]},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["chat about my goals"],
-                idempotency="idempotent",
-                side_effect_scope="none",
-            ),
-            cap(
-                name="runtime.cancel_generation",
-                description="Cancel active generation",
-                input_schema={"type": "object"},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["stop generating"],
-                idempotency="idempotent",
-                side_effect_scope="none",
-            ),
-            cap(
-                name="runtime.compact_context",
-                description="Compact current context when token budget is high",
-                input_schema={"type": "object"},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["compact context"],
-                idempotency="idempotent",
-                side_effect_scope="none",
-            ),
-        ]
+    def __init__(self, ctx) -> None:
+        super().__init__(ctx)
+        self._dispatch = {
+            "chat.general": self._handle_chat,
+            "runtime.cancel_generation": self._handle_cancel,
+            "runtime.compact_context": self._handle_compact,
+        }
+        self._plan_cache: Dict[str, Tuple[Tuple[int, int], List[str]]] = {}
 
-    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        intent = message.get("intent")
+    def capabilities(self) -> Tuple[CapabilityMetadata, ...]:
+        return _CAPABILITIES
+
+    def _plan_bullets(self, plan_path: Path) -> List[str] | None:
+        try:
+            st = plan_path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
 
-        if intent == "runtime.cancel_generation":
-            return make_response("runtime.cancelled", {"cancelled": True}, message.get("message_id"))
+        key = str(plan_path)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._plan_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-        if intent == "runtime.compact_context":
-            return make_response(
-                "runtime.context_compacted",
-                {
-                    "compacted": True,
-                    "notice": "Conversation context was compacted to preserve responsiveness.",
-                },
-                message.get("message_id"),
-            )
+        bullets: List[str] = []
+        for line in plan_path.read_text(encoding="utf-8").splitlines():
+            stripped = line.lstrip()
+            if stripped.startswith("- "):
+                bullets.append(stripped.rstrip())
+        self._plan_cache[key] = (signature, bullets)
+        return bullets
 
-        if intent != "chat.general":
-            return make_error("E_NO_ROUTE", "Unsupported intent", message.get("message_id"))
+    def _handle_cancel(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        return make_response("runtime.cancelled", {"cancelled": True}, message_id)
+
+    def _handle_compact(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        return make_response(
+            "runtime.context_compacted",
+            {
+                "compacted": True,
+                "notice": "Conversation context was compacted to preserve responsiveness.",
+            },
+            message_id,
+        )
 
-        text = str(message.get("payload", {}).get("text", ""))
-        lowered = text.lower()
+    def _handle_chat(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        text = str(payload.get("text", ""))
 
-        if "what next" in lowered and self.ctx.workflow_state is not None:
+        if "what next" in text.lower() and self.ctx.workflow_state is not None:
             active_folder = str(self.ctx.workflow_state.read("active_folder", ""))
             if active_folder:
-                plan_path = self.ctx.library_root / active_folder / "plan.md"
-                if plan_path.exists() and plan_path.is_file():
-                    plan_text = plan_path.read_text(encoding="utf-8")
-                    bullets = [line.strip() for line in plan_text.splitlines() if line.strip().startswith("- ")]
+                bullets = self._plan_bullets(self.ctx.library_root / active_folder / "plan.md")
+                if bullets is not None:
                     next_steps = bullets[:3] if bullets else ["Review plan milestones and pick the top-priority task."]
                     return make_response(
                         "chat.response",
@@ -84,7 +112,7 @@ class ChatGeneralNode(ProtocolNode):
                             "next_steps": next_steps,
                             "source": f"{active_folder}/plan.md",
                         },
-                        message.get("message_id"),
+                        message_id,
                     )
 
         return make_response(
@@ -93,5 +121,14 @@ class ChatGeneralNode(ProtocolNode):
                 "text": text,
                 "note": "Handled by interface.cli",
             },
-            message.get("message_id"),
+            message_id,
         )
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        intent, payload, message_id = normalize_message(message)
+        handler = self._dispatch.get(intent)
+        if handler is None:
+            return make_error("E_NO_ROUTE", "Unsupported intent", message_id)
+        if payload is None:
+            return make_error("E_BAD_MESSAGE", "payload must be object", message_id)
+        return handler(message, payload, message_id)
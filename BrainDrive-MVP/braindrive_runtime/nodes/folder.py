@@ -1,53 +1,75 @@
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-from ..protocol import make_error, make_response
+from ..metadata import CapabilityMetadata
+from ..protocol import make_error, make_response, normalize_message
 from .base import ProtocolNode, cap
 
+_SLUG_STRIP_RE = re.compile(r"[^a-zA-Z0-9\-_\s]")
+# ASCII bytes _SLUG_STRIP_RE would remove; lets ASCII topics skip the regex engine.
+_SLUG_STRIP_ASCII = bytes(
+    c for c in range(128) if not (chr(c).isalnum() or chr(c) in "-_" or chr(c).isspace())
+)
+_SLUG_DASH_RE = re.compile(r"[\s_]+")
+_CONTEXT_DOC_NAMES = ("AGENT.md", "spec.md", "plan.md")
+_CONTEXT_DOC_MAX_CHARS = 256 * 1024
+
+_CAPABILITIES = (
+    cap(
+        name="folder.create",
+        description="Create topic folder with AGENT.md",
+        input_schema={"type": "object", "required": ["topic"]},
+        risk_class="mutate",
+        required_extensions=[],
+        approval_required=True,
+        examples=["create folder for finances"],
+        idempotency="non_idempotent",
+        side_effect_scope="file",
+    ),
+    cap(
+        name="folder.switch",
+        description="Switch active folder context",
+        input_schema={"type": "object", "required": ["folder"]},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["switch to finances"],
+        idempotency="idempotent",
+        side_effect_scope="none",
+    ),
+    cap(
+        name="folder.list",
+        description="List available folders",
+        input_schema={"type": "object"},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["list folders"],
+        idempotency="idempotent",
+        side_effect_scope="none",
+    ),
+)
+
 
 class FolderWorkflowNode(ProtocolNode):
     node_id = "node.workflow.folder"
     priority = 140
 
-    def capabilities(self) -> List:
-        return [
-            cap(
-                name="folder.create",
-                description="Create topic folder with AGENT.md",
-                input_schema={"type": "object", "required": ["topic"]},
-                risk_class="mutate",
-                required_extensions=[],
-                approval_required=True,
-                examples=["create folder for finances"],
-                idempotency="non_idempotent",
-                side_effect_scope="file",
-            ),
-            cap(
-                name="folder.switch",
-                description="Switch active folder context",
-                input_schema={"type": "object", "required": ["folder"]},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["switch to finances"],
-                idempotency="idempotent",
-                side_effect_scope="none",
-            ),
-            cap(
-                name="folder.list",
-                description="List available folders",
-                input_schema={"type": "object"},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["list folders"],
-                idempotency="idempotent",
-                side_effect_scope="none",
-            ),
-        ]
+    def __init__(self, ctx) -> None:
+        super().__init__(ctx)
+        self._folders_cache: Tuple[int, List[str]] | None = None
+        self._dispatch = {
+            "folder.list": self._handle_list,
+            "folder.switch": self._handle_switch,
+            "folder.create": self._handle_create,
+        }
+
+    def capabilities(self) -> Tuple[CapabilityMetadata, ...]:
+        return _CAPABILITIES
 
     def _state(self) -> Dict[str, Any]:
         if self.ctx.workflow_state is None:
@@ -59,103 +81,126 @@ class FolderWorkflowNode(ProtocolNode):
             self.ctx.workflow_state.update(patch)
 
     def _slug(self, text: str) -> str:
-        slug = re.sub(r"[^a-zA-Z0-9\-_\s]", "", text.strip().lower())
-        slug = re.sub(r"[\s_]+", "-", slug).strip("-")
+        lowered = text.strip().lower()
+        if lowered.isascii():
+            stripped = lowered.encode("ascii").translate(None, _SLUG_STRIP_ASCII).decode("ascii")
+        else:
+            stripped = _SLUG_STRIP_RE.sub("", lowered)
+        slug = _SLUG_DASH_RE.sub("-", stripped).strip("-")
         return slug or "untitled-topic"
 
     def _folders(self) -> List[str]:
-        folders: List[str] = []
-        for child in sorted(self.ctx.library_root.iterdir()):
-            if not child.is_dir():
-                continue
-            if child.name.startswith("."):
-                continue
-            folders.append(child.name)
-        return folders
-
-    def _load_context_docs(self, folder_dir: Path) -> Dict[str, str]:
-        docs = {}
-        for filename in ["AGENT.md", "spec.md", "plan.md"]:
-            path = folder_dir / filename
-            if path.exists() and path.is_file():
-                docs[filename] = path.read_text(encoding="utf-8")
-        return docs
+        mtime_ns = self.ctx.library_root.stat().st_mtime_ns
+        cached = self._folders_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+
+        with os.scandir(self.ctx.library_root) as entries:
+            folders = sorted(entry.name for entry in entries if not entry.name.startswith(".") and entry.is_dir())
+        self._folders_cache = (mtime_ns, folders)
+        return list(folders)
+
+    def _load_context_docs(self, folder_dir: Path) -> Tuple[Dict[str, str], List[str]]:
+        found: Dict[str, str] = {}
+        with os.scandir(folder_dir) as entries:
+            for entry in entries:
+                if entry.name in _CONTEXT_DOC_NAMES and entry.is_file():
+                    found[entry.name] = entry.path
 
-    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        intent = message.get("intent")
-        payload = message.get("payload", {})
-        if not isinstance(payload, dict):
-            return make_error("E_BAD_MESSAGE", "payload must be object", message.get("message_id"))
-
-        if intent == "folder.list":
-            return make_response(
-                "folder.listed",
-                {
-                    "folders": self._folders(),
-                    "active_folder": self._state().get("active_folder", ""),
-                },
-                message.get("message_id"),
+        docs = {}
+        truncated: List[str] = []
+        for filename in _CONTEXT_DOC_NAMES:
+            path = found.get(filename)
+            if path is not None:
+                # One char past the cap tells a doc that fits from one that was cut off.
+                with open(path, encoding="utf-8") as handle:
+                    text = handle.read(_CONTEXT_DOC_MAX_CHARS + 1)
+                if len(text) > _CONTEXT_DOC_MAX_CHARS:
+                    text = text[:_CONTEXT_DOC_MAX_CHARS]
+                    truncated.append(filename)
+                docs[filename] = text
+        return docs, truncated
+
+    def _handle_list(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        return make_response(
+            "folder.listed",
+            {
+                "folders": self._folders(),
+                "active_folder": self._state().get("active_folder", ""),
+            },
+            message_id,
+        )
+
+    def _handle_switch(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        folder = str(payload.get("folder", "")).strip()
+        if not folder:
+            return make_error("E_BAD_MESSAGE", "folder is required", message_id)
+
+        folder_dir = self.ctx.library_root / folder
+        if not folder_dir.is_dir():
+            return make_error(
+                "E_NODE_ERROR",
+                f"Folder not found: {folder}",
+                message_id,
+                details={"folders": self._folders()},
             )
 
-        if intent == "folder.switch":
-            folder = str(payload.get("folder", "")).strip()
-            if not folder:
-                return make_error("E_BAD_MESSAGE", "folder is required", message.get("message_id"))
-
-            folder_dir = self.ctx.library_root / folder
-            if not folder_dir.exists() or not folder_dir.is_dir():
-                return make_error(
-                    "E_NODE_ERROR",
-                    f"Folder not found: {folder}",
-                    message.get("message_id"),
-                    details={"folders": self._folders()},
-                )
-
-            self._update_state({"active_folder": folder})
-            return make_response(
-                "folder.switched",
-                {
-                    "active_folder": folder,
-                    "context_docs": self._load_context_docs(folder_dir),
-                },
-                message.get("message_id"),
+        self._update_state({"active_folder": folder})
+        context_docs, truncated = self._load_context_docs(folder_dir)
+        return make_response(
+            "folder.switched",
+            {
+                "active_folder": folder,
+                "context_docs": context_docs,
+                "context_docs_truncated": truncated,
+            },
+            message_id,
+        )
+
+    def _handle_create(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        confirmation = (message.get("extensions", {}) or {}).get("confirmation", {})
+        if str(confirmation.get("status", "")).lower() != "approved":
+            return make_error("E_CONFIRMATION_REQUIRED", "Approval required before folder creation", message_id)
+
+        topic = str(payload.get("topic", "")).strip()
+        if not topic:
+            return make_error("E_BAD_MESSAGE", "topic is required", message_id)
+
+        folder = str(payload.get("folder", "")).strip() or self._slug(topic)
+        folder_dir = self.ctx.library_root / folder
+        folder_dir.mkdir(parents=True, exist_ok=True)
+        self._folders_cache = None
+
+        agent_path = folder_dir / "AGENT.md"
+        if not agent_path.exists():
+            agent_path.write_text(
+                (
+                    f"# {topic}\n\n"
+                    "## Purpose\n"
+                    f"Working folder for {topic}.\n\n"
+                    "## Protocol Rules\n"
+                    "- No writes without explicit approval.\n"
+                    "- Keep goals, context, and plan grounded in this folder.\n"
+                ),
+                encoding="utf-8",
             )
 
-        if intent == "folder.create":
-            confirmation = (message.get("extensions", {}) or {}).get("confirmation", {})
-            if str(confirmation.get("status", "")).lower() != "approved":
-                return make_error("E_CONFIRMATION_REQUIRED", "Approval required before folder creation", message.get("message_id"))
-
-            topic = str(payload.get("topic", "")).strip()
-            if not topic:
-                return make_error("E_BAD_MESSAGE", "topic is required", message.get("message_id"))
-
-            folder = str(payload.get("folder", "")).strip() or self._slug(topic)
-            folder_dir = self.ctx.library_root / folder
-            folder_dir.mkdir(parents=True, exist_ok=True)
-
-            agent_path = folder_dir / "AGENT.md"
-            if not agent_path.exists():
-                agent_path.write_text(
-                    (
-                        f"# {topic}\n\n"
-                        "## Purpose\n"
-                        f"Working folder for {topic}.\n\n"
-                        "## Protocol Rules\n"
-                        "- No writes without explicit approval.\n"
-                        "- Keep goals, context, and plan grounded in this folder.\n"
-                    ),
-                    encoding="utf-8",
-                )
-
-            self._update_state({"active_folder": folder})
-            return make_response(
-                "folder.created",
-                {
-                    "folder": folder,
-                    "agent_path": str(agent_path.relative_to(self.ctx.library_root)).replace("\\", "/"),
-                },
-                message.get("message_id"),
-            )
+        self._update_state({"active_folder": folder})
+        return make_response(
+            "folder.created",
+            {
+                "folder": folder,
+                "agent_path": str(agent_path.relative_to(self.ctx.library_root)).replace("\\", "/"),
+            },
+            message_id,
+        )
 
-        return make_error("E_NO_ROUTE", "Unsupported intent", message.get("message_id"))
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        intent, payload, message_id = normalize_message(message)
+        if payload is None:
+            return make_error("E_BAD_MESSAGE", "payload must be object", message_id)
+
+        handler = self._dispatch.get(intent)
+        if handler is None:
+            return make_error("E_NO_ROUTE", "Unsupported intent", message_id)
+        return handler(message, payload, message_id)
@@ -1,17 +1,58 @@
 from __future__ import annotations
 
+import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 
 from ..protocol import make_error, make_response
-from .base import ProtocolNode, cap
+from .base import ProtocolNode, cap, library_lock
+
+try:  # pragma: no cover - depends on optional pygit2 install
+    import pygit2
+except ImportError:  # pragma: no cover
+    pygit2 = None  # type: ignore[assignment]
+
+_COMMIT_NAME = "BrainDrive"
+_COMMIT_EMAIL = "braindrive@local"
+
+_REPO_CACHE: Dict[Path, Any] = {}
+_REPO_CACHE_LOCK = threading.Lock()
+
+
+def _sq_quote(value: str) -> str:
+    return "'" + value.replace("'", "'\\''") + "'"
+
+
+def _git_env(library_root: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    params = " ".join(
+        _sq_quote(item)
+        for item in (
+            f"safe.directory={library_root}",
+            f"user.name={_COMMIT_NAME}",
+            f"user.email={_COMMIT_EMAIL}",
+        )
+    )
+    inherited = env.get("GIT_CONFIG_PARAMETERS", "").strip()
+    env["GIT_CONFIG_PARAMETERS"] = f"{inherited} {params}" if inherited else params
+    return env
 
 
 class GitOpsNode(ProtocolNode):
     node_id = "node.git.ops"
     priority = 120
 
+    def __init__(self, ctx) -> None:
+        super().__init__(ctx)
+        self._root = self.ctx.library_root.resolve()
+        self._library_lock = library_lock(self._root)
+        self._git_env = _git_env(self.ctx.library_root)
+        self._object_reader: subprocess.Popen[bytes] | None = None
+        self._object_reader_lock = threading.Lock()
+
     def capabilities(self) -> List:
         return [
             cap(
@@ -39,27 +80,217 @@ class GitOpsNode(ProtocolNode):
         ]
 
     def _git(self, *args: str) -> subprocess.CompletedProcess[str]:
-        safe_dir = str(self.ctx.library_root)
         return subprocess.run(
-            ["git", "-c", f"safe.directory={safe_dir}", "-C", str(self.ctx.library_root), *args],
+            ["git", *args],
+            cwd=self.ctx.library_root,
+            env=self._git_env,
             text=True,
             capture_output=True,
             check=False,
         )
 
+    def _git_bytes(self, *args: str) -> subprocess.CompletedProcess[bytes]:
+        # For calls whose output is only tested, not shown; skips decoding the whole buffer.
+        return subprocess.run(
+            ["git", *args],
+            cwd=self.ctx.library_root,
+            env=self._git_env,
+            capture_output=True,
+            check=False,
+        )
+
+    def _close_object_reader(self) -> None:
+        reader = self._object_reader
+        self._object_reader = None
+        if reader is not None:
+            reader.stdin.close()
+            reader.wait()
+
+    def _resolve_ref(self, ref: str) -> str:
+        # One long-lived cat-file process answers ref lookups instead of a rev-parse per commit.
+        with self._object_reader_lock:
+            line = b""
+            for _ in range(2):
+                if self._object_reader is None or self._object_reader.poll() is not None:
+                    self._object_reader = subprocess.Popen(
+                        ["git", "cat-file", "--batch-check"],
+                        cwd=self.ctx.library_root,
+                        env=self._git_env,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                    )
+                try:
+                    self._object_reader.stdin.write(ref.encode("utf-8") + b"\n")
+                    self._object_reader.stdin.flush()
+                    line = self._object_reader.stdout.readline()
+                except OSError:
+                    line = b""
+                if line:
+                    break
+                self._close_object_reader()
+        name, _, rest = line.decode("utf-8").strip().partition(" ")
+        return name if rest and rest != "missing" else ""
+
+    def flush(self) -> None:
+        with self._object_reader_lock:
+            self._close_object_reader()
+
     def _is_repo(self) -> bool:
         return (self.ctx.library_root / ".git").exists()
 
+    def _init_repo(self) -> str | None:
+        if pygit2 is not None:
+            try:
+                repo = pygit2.init_repository(str(self._root))
+            except pygit2.GitError as exc:
+                return str(exc)
+            with _REPO_CACHE_LOCK:
+                _REPO_CACHE[self._root] = repo
+            return None
+        result = self._git("init")
+        return None if result.returncode == 0 else result.stderr.strip()
+
+    def _open_repo(self) -> "pygit2.Repository | None":
+        if pygit2 is None:
+            return None
+        with _REPO_CACHE_LOCK:
+            repo = _REPO_CACHE.get(self._root)
+            if repo is None:
+                try:
+                    repo = pygit2.Repository(str(self._root))
+                except pygit2.GitError:
+                    # e.g. libgit2 owner validation; the CLI path passes safe.directory instead.
+                    return None
+                _REPO_CACHE[self._root] = repo
+        return repo
+
+    def _commit_in_process(
+        self,
+        repo: "pygit2.Repository",
+        safe_paths: List[str],
+        payload: Dict[str, Any],
+        message_id: Any,
+    ) -> Dict[str, Any]:
+        try:
+            index = repo.index
+            index.read(False)
+            index.add_all(safe_paths)
+            index.update_all(safe_paths)
+            index.write()
+        except pygit2.GitError as exc:
+            return make_error("E_NODE_ERROR", "git add failed", message_id, details={"stderr": str(exc)})
+
+        try:
+            changed = bool(repo.status())
+        except pygit2.GitError:
+            return make_error("E_NODE_ERROR", "git status failed", message_id)
+        if not changed:
+            return make_response("git.commit.skipped", {"reason": "no_changes"}, message_id)
+
+        commit_message = str(payload.get("commit_message", "")).strip()
+        if not commit_message:
+            return make_error("E_BAD_MESSAGE", "commit_message is required", message_id)
+
+        try:
+            tree = index.write_tree()
+            if repo.head_is_unborn:
+                parents: List[Any] = []
+                unchanged = len(index) == 0
+            else:
+                head = repo.head.peel(pygit2.Commit)
+                parents = [head.id]
+                unchanged = head.tree_id == tree
+            if unchanged:
+                return make_error(
+                    "E_NODE_ERROR",
+                    "git commit failed",
+                    message_id,
+                    details={"stderr": "nothing to commit"},
+                )
+            signature = pygit2.Signature(_COMMIT_NAME, _COMMIT_EMAIL)
+            oid = repo.create_commit("HEAD", signature, signature, commit_message + "\n", tree, parents)
+        except pygit2.GitError as exc:
+            return make_error("E_NODE_ERROR", "git commit failed", message_id, details={"stderr": str(exc)})
+
+        return make_response(
+            "git.committed",
+            {
+                "paths": safe_paths,
+                "commit": str(oid),
+                "message": commit_message,
+            },
+            message_id,
+        )
+
     def _safe_rel_path(self, raw: str) -> str:
         rel = raw.replace("\\", "/").strip()
         if not rel:
             raise ValueError("path cannot be empty")
-        target = (self.ctx.library_root / rel).resolve()
-        root = self.ctx.library_root.resolve()
-        if target != root and root not in target.parents:
+        if not (self._root / rel).resolve().is_relative_to(self._root):
             raise ValueError("path traversal rejected")
         return rel
 
+    def _commit_approved_change(self, payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        if not self._is_repo() and self._init_repo() is not None:
+            return make_error("E_NODE_ERROR", "git init failed", message_id)
+
+        paths = payload.get("paths", [])
+        if not isinstance(paths, list) or not paths:
+            return make_error("E_BAD_MESSAGE", "paths must be non-empty list", message_id)
+
+        try:
+            safe_paths = [self._safe_rel_path(str(item)) for item in paths]
+        except ValueError as exc:
+            return make_error("E_BAD_MESSAGE", str(exc), message_id)
+
+        repo = self._open_repo()
+        if repo is not None:
+            return self._commit_in_process(repo, safe_paths, payload, message_id)
+
+        # Whether the tree has any change is the same before and after staging, so
+        # status runs alongside add; --no-optional-locks keeps it off index.lock.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending_status = pool.submit(self._git_bytes, "--no-optional-locks", "status", "--porcelain")
+            add = self._git("add", *safe_paths)
+            status = pending_status.result()
+        if add.returncode != 0:
+            return make_error(
+                "E_NODE_ERROR",
+                "git add failed",
+                message_id,
+                details={"stderr": add.stderr.strip()},
+            )
+
+        if status.returncode != 0:
+            return make_error("E_NODE_ERROR", "git status failed", message_id)
+        if not status.stdout.strip():
+            return make_response("git.commit.skipped", {"reason": "no_changes"}, message_id)
+
+        commit_message = str(payload.get("commit_message", "")).strip()
+        if not commit_message:
+            return make_error("E_BAD_MESSAGE", "commit_message is required", message_id)
+
+        commit = self._git("commit", "-m", commit_message)
+        if commit.returncode != 0:
+            return make_error(
+                "E_NODE_ERROR",
+                "git commit failed",
+                message_id,
+                details={"stderr": commit.stderr.strip()},
+            )
+
+        sha = self._resolve_ref("HEAD")
+        return make_response(
+            "git.committed",
+            {
+                "paths": safe_paths,
+                "commit": sha,
+                "message": commit_message,
+            },
+            message_id,
+        )
+
     def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
         intent = message.get("intent")
         payload = message.get("payload", {})
@@ -70,87 +301,19 @@ class GitOpsNode(ProtocolNode):
             if self._is_repo():
                 return make_response("git.ready", {"initialized": False}, message.get("message_id"))
 
-            result = self._git("init")
-            if result.returncode != 0:
+            init_error = self._init_repo()
+            if init_error is not None:
                 return make_error(
                     "E_NODE_ERROR",
                     "git init failed",
                     message.get("message_id"),
-                    details={"stderr": result.stderr.strip()},
+                    details={"stderr": init_error},
                 )
             return make_response("git.ready", {"initialized": True}, message.get("message_id"))
 
         if intent == "git.commit.approved_change":
-            if not self._is_repo():
-                init = self._git("init")
-                if init.returncode != 0:
-                    return make_error("E_NODE_ERROR", "git init failed", message.get("message_id"))
-
-            paths = payload.get("paths", [])
-            if not isinstance(paths, list) or not paths:
-                return make_error("E_BAD_MESSAGE", "paths must be non-empty list", message.get("message_id"))
-
-            try:
-                safe_paths = [self._safe_rel_path(str(item)) for item in paths]
-            except ValueError as exc:
-                return make_error("E_BAD_MESSAGE", str(exc), message.get("message_id"))
-
-            add = self._git("add", *safe_paths)
-            if add.returncode != 0:
-                return make_error(
-                    "E_NODE_ERROR",
-                    "git add failed",
-                    message.get("message_id"),
-                    details={"stderr": add.stderr.strip()},
-                )
-
-            status = self._git("status", "--porcelain")
-            if status.returncode != 0:
-                return make_error("E_NODE_ERROR", "git status failed", message.get("message_id"))
-            if not status.stdout.strip():
-                return make_response("git.commit.skipped", {"reason": "no_changes"}, message.get("message_id"))
-
-            commit_message = str(payload.get("commit_message", "")).strip()
-            if not commit_message:
-                return make_error("E_BAD_MESSAGE", "commit_message is required", message.get("message_id"))
-
-            commit = subprocess.run(
-                [
-                    "git",
-                    "-c",
-                    f"safe.directory={self.ctx.library_root}",
-                    "-C",
-                    str(self.ctx.library_root),
-                    "-c",
-                    "user.name=BrainDrive",
-                    "-c",
-                    "user.email=braindrive@local",
-                    "commit",
-                    "-m",
-                    commit_message,
-                ],
-                text=True,
-                capture_output=True,
-                check=False,
-            )
-            if commit.returncode != 0:
-                return make_error(
-                    "E_NODE_ERROR",
-                    "git commit failed",
-                    message.get("message_id"),
-                    details={"stderr": commit.stderr.strip()},
-                )
-
-            head = self._git("rev-parse", "HEAD")
-            sha = head.stdout.strip() if head.returncode == 0 else ""
-            return make_response(
-                "git.committed",
-                {
-                    "paths": safe_paths,
-                    "commit": sha,
-                    "message": commit_message,
-                },
-                message.get("message_id"),
-            )
+            # memory.fs writes take the same lock, so a commit never stages a half-applied change.
+            with self._library_lock:
+                return self._commit_approved_change(payload, message.get("message_id"))
 
         return make_error("E_NO_ROUTE", "Unsupported intent", message.get("message_id"))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -8,10 +10,22 @@ from ..protocol import make_error, new_uuid
 from .base import NodeContext
 
 
+# Line boundaries str.splitlines() honours besides "\n" ("\r\n" included via "\r").
+_OTHER_LINE_BREAKS = ("\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+
+
 def _strip_markdown_fence(text: str) -> str:
     cleaned = text.strip()
     if not cleaned.startswith("```"):
         return cleaned
+    if not any(ch in cleaned for ch in _OTHER_LINE_BREAKS):
+        # "\n"-only text: slice between the first and last line instead of splitting every line.
+        first = cleaned.find("\n")
+        if first == -1:
+            return cleaned
+        last = cleaned.rfind("\n")
+        end = last if cleaned[last + 1 :].lstrip().startswith("```") else len(cleaned)
+        return cleaned[first + 1 : end].strip() or cleaned
     lines = cleaned.splitlines()
     if not lines:
         return cleaned
@@ -21,13 +35,23 @@ def _strip_markdown_fence(text: str) -> str:
     return "\n".join(body).strip() or cleaned
 
 
+@lru_cache(maxsize=64)
+def _read_skill(path: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size are only part of the cache key; an edited skill file misses.
+    return Path(path).read_text(encoding="utf-8")
+
+
 class LLMSkillDriver:
     def __init__(self, ctx: NodeContext) -> None:
         self.ctx = ctx
 
     def load_skill(self, filename: str, parent_message_id: Optional[str]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
         path = self.ctx.library_root / ".braindrive" / "skills" / filename
-        if not path.exists() or not path.is_file():
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             return None, make_error(
                 E_NODE_ERROR,
                 f"Skill file not found: {filename}",
@@ -37,7 +61,7 @@ class LLMSkillDriver:
             )
 
         try:
-            return path.read_text(encoding="utf-8"), None
+            return _read_skill(str(path), st.st_mtime_ns, st.st_size), None
         except Exception as exc:
             return None, make_error(
                 E_NODE_ERROR,
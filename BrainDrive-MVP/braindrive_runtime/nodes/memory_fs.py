@@ -1,16 +1,115 @@
 from __future__ import annotations
 
+import os
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 from ..protocol import make_error, make_response
-from .base import ProtocolNode, cap
+from .base import ProtocolNode, cap, library_lock
+
+_PREVIEW_BEFORE_CHARS = 40
+_PREVIEW_AFTER_CHARS = 100
+# UTF-8 uses at most 4 bytes per character.
+_UTF8_MAX_BYTES = 4
+# Files per search task; per-file tasks cost more in executor overhead than the reads save.
+_SEARCH_CHUNK_FILES = 64
+_SEARCH_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+_SEARCH_CACHE_SIZE = 128
+_LIST_CACHE_SIZE = 128
+
+
+def _universal_newlines(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _iter_markdown(directory: str, prefix: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+    # Same order as Path.rglob("*.md"): a directory's files, then each subdirectory in turn.
+    try:
+        with os.scandir(directory) as entries_it:
+            entries = list(entries_it)
+    except PermissionError:
+        return
+    for entry in entries:
+        if entry.name.endswith(".md") and entry.is_file():
+            yield prefix + entry.name, entry
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_markdown(entry.path, f"{prefix}{entry.name}/")
+
+
+def _search_needle(query: str) -> str | bytes:
+    needle = query.lower()
+    return needle.encode("ascii") if needle.isascii() else needle
+
+
+def _match_preview(data: bytes, needle: str | bytes) -> str | None:
+    if isinstance(needle, bytes):
+        # ASCII bytes never occur inside a multi-byte UTF-8 sequence, so the file can be
+        # searched undecoded and only the preview window around the hit decoded.
+        index = data.lower().find(needle)
+        if index == -1:
+            return None
+        before = data[max(0, index - _PREVIEW_BEFORE_CHARS * _UTF8_MAX_BYTES) : index].decode("utf-8", "ignore")
+        after = data[index : index + _PREVIEW_AFTER_CHARS * _UTF8_MAX_BYTES].decode("utf-8", "ignore")
+    else:
+        content = _universal_newlines(data.decode("utf-8", "replace"))
+        index = content.lower().find(needle)
+        if index == -1:
+            return None
+        before = content[max(0, index - _PREVIEW_BEFORE_CHARS) : index]
+        after = content[index : index + _PREVIEW_AFTER_CHARS]
+    before = _universal_newlines(before)[-_PREVIEW_BEFORE_CHARS:]
+    after = _universal_newlines(after)[:_PREVIEW_AFTER_CHARS]
+    return (before + after).replace("\n", " ")
+
+
+def _write_document(target: Path, text: str) -> int:
+    # Encode once and append the trailing newline as its own write rather than
+    # copying the whole document into a new string first.
+    data = text.encode("utf-8")
+    # Readers see either the old or the new document, never a partial write.
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        with open(tmp, "wb") as handle:
+            handle.write(data)
+            if not data.endswith(b"\n"):
+                handle.write(b"\n")
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return len(data)
+
+
+def _search_files(files: List[Tuple[str, os.DirEntry]], needle: str | bytes) -> List[Dict[str, str]]:
+    results = []
+    for rel_path, entry in files:
+        with open(entry.path, "rb") as handle:
+            preview = _match_preview(handle.read(), needle)
+        if preview is not None:
+            results.append({"path": rel_path, "preview": preview})
+    return results
 
 
 class MemoryFsNode(ProtocolNode):
     node_id = "node.memory.fs"
     priority = 180
 
+    def __init__(self, ctx) -> None:
+        super().__init__(ctx)
+        self._root = self.ctx.library_root.resolve()
+        self._library_lock = library_lock(self._root)
+        self._search_cache: OrderedDict[str | bytes, Tuple[List[Tuple[str, int, int]], List[Dict[str, str]]]] = OrderedDict()
+        # Node services handle requests on threads and reads skip the library lock, so every
+        # cache lookup, insert, eviction and clear happens under this lock.
+        self._cache_lock = threading.Lock()
+        self._list_cache: OrderedDict[Path, Tuple[int, Tuple[str, ...], Tuple[bool, ...]]] = OrderedDict()
+
     def capabilities(self) -> List:
         return [
             cap(
@@ -86,12 +185,81 @@ class MemoryFsNode(ProtocolNode):
         if not rel:
             raise ValueError("path is required")
 
-        target = (self.ctx.library_root / rel).resolve()
-        root = self.ctx.library_root.resolve()
-        if target != root and root not in target.parents:
+        target = (self._root / rel).resolve()
+        if not target.is_relative_to(self._root):
             raise ValueError("path traversal rejected")
         return target
 
+    def _invalidate_caches(self) -> None:
+        # The stat fingerprint can miss a same-size rewrite within one mtime tick; our own
+        # mutations drop the caches outright.
+        with self._cache_lock:
+            self._search_cache.clear()
+            self._list_cache.clear()
+
+    def _list_dir(self, base: Path) -> List[Dict[str, Any]] | None:
+        try:
+            base_stat = os.stat(base)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISDIR(base_stat.st_mode):
+            return None
+        # A directory's mtime moves whenever an entry is added, removed or renamed.
+        with self._cache_lock:
+            cached = self._list_cache.get(base)
+            if cached is not None and cached[0] == base_stat.st_mtime_ns:
+                self._list_cache.move_to_end(base)
+            else:
+                cached = None
+        if cached is not None:
+            paths, is_dirs = cached[1], cached[2]
+        else:
+            prefix = "" if base == self._root else base.relative_to(self._root).as_posix() + "/"
+            with os.scandir(base) as entries_it:
+                children = sorted(entries_it, key=attrgetter("name"))
+            # Cached as parallel tuples; the wire dicts are built once per response.
+            paths = tuple(prefix + child.name for child in children)
+            is_dirs = tuple(child.is_dir() for child in children)
+            with self._cache_lock:
+                self._list_cache[base] = (base_stat.st_mtime_ns, paths, is_dirs)
+                self._list_cache.move_to_end(base)
+                if len(self._list_cache) > _LIST_CACHE_SIZE:
+                    self._list_cache.popitem(last=False)
+        return [{"path": path, "is_dir": is_dir} for path, is_dir in zip(paths, is_dirs)]
+
+    def _search(self, needle: str | bytes) -> List[Dict[str, str]]:
+        files = list(_iter_markdown(str(self.ctx.library_root)))
+        # Any added, removed, or rewritten markdown file changes the fingerprint.
+        fingerprint = []
+        for rel_path, entry in files:
+            info = entry.stat()
+            fingerprint.append((rel_path, info.st_mtime_ns, info.st_size))
+        with self._cache_lock:
+            cached = self._search_cache.get(needle)
+            if cached is not None and cached[0] == fingerprint:
+                self._search_cache.move_to_end(needle)
+            else:
+                cached = None
+        if cached is not None:
+            return [dict(match) for match in cached[1]]
+
+        if len(files) <= _SEARCH_CHUNK_FILES:
+            results = _search_files(files, needle)
+        else:
+            chunks = [files[i : i + _SEARCH_CHUNK_FILES] for i in range(0, len(files), _SEARCH_CHUNK_FILES)]
+            results = []
+            # File reads release the GIL; map() keeps results in walk order.
+            with ThreadPoolExecutor(max_workers=min(len(chunks), _SEARCH_MAX_WORKERS)) as pool:
+                for chunk_results in pool.map(_search_files, chunks, [needle] * len(chunks)):
+                    results.extend(chunk_results)
+
+        with self._cache_lock:
+            self._search_cache[needle] = (fingerprint, results)
+            self._search_cache.move_to_end(needle)
+            if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return [dict(match) for match in results]
+
     def _confirmation_ok(self, message: Dict[str, Any]) -> bool:
         confirmation = (message.get("extensions", {}) or {}).get("confirmation", {})
         return isinstance(confirmation, dict) and str(confirmation.get("status", "")).lower() == "approved"
@@ -106,19 +274,9 @@ class MemoryFsNode(ProtocolNode):
         try:
             if intent == "memory.list":
                 rel = str(payload.get("path", "."))
-                base = self._safe_path(rel)
-                if not base.exists() or not base.is_dir():
+                entries = self._list_dir(self._safe_path(rel))
+                if entries is None:
                     return make_error("E_NODE_ERROR", f"Directory not found: {rel}", message.get("message_id"))
-
-                entries = []
-                for child in sorted(base.iterdir()):
-                    rel_path = child.resolve().relative_to(self.ctx.library_root.resolve())
-                    entries.append(
-                        {
-                            "path": str(rel_path).replace("\\", "/"),
-                            "is_dir": child.is_dir(),
-                        }
-                    )
                 return make_response("memory.listed", {"entries": entries}, message.get("message_id"))
 
             if intent == "memory.read":
@@ -139,18 +297,7 @@ class MemoryFsNode(ProtocolNode):
                 query = str(payload.get("query", "")).strip()
                 if not query:
                     return make_error("E_BAD_MESSAGE", "query is required", message.get("message_id"))
-                results = []
-                for path in self.ctx.library_root.rglob("*.md"):
-                    if not path.is_file():
-                        continue
-                    content = path.read_text(encoding="utf-8")
-                    index = content.lower().find(query.lower())
-                    if index == -1:
-                        continue
-                    rel_path = str(path.resolve().relative_to(self.ctx.library_root.resolve())).replace("\\", "/")
-                    start = max(0, index - 40)
-                    preview = content[start : index + 100].replace("\n", " ")
-                    results.append({"path": rel_path, "preview": preview})
+                results = self._search(_search_needle(query))
                 return make_response("memory.search.results", {"query": query, "matches": results}, message.get("message_id"))
 
             if intent == "memory.write.propose":
@@ -161,8 +308,10 @@ class MemoryFsNode(ProtocolNode):
                 content = str(payload.get("content", ""))
                 target = self._safe_path(rel)
                 target.parent.mkdir(parents=True, exist_ok=True)
-                target.write_text(content if content.endswith("\n") else content + "\n", encoding="utf-8")
-                self.ctx.persistence.emit_event("workflow", "memory.write", {"path": rel, "bytes": len(content.encode("utf-8"))})
+                with self._library_lock:
+                    written = _write_document(target, content)
+                    self._invalidate_caches()
+                    self.ctx.persistence.emit_event("workflow", "memory.write", {"path": rel, "bytes": written})
                 return make_response("memory.write.applied", {"path": rel}, message.get("message_id"))
 
             if intent == "memory.edit.propose":
@@ -174,20 +323,22 @@ class MemoryFsNode(ProtocolNode):
                 if not target.exists() or not target.is_file():
                     return make_error("E_NODE_ERROR", f"File not found: {rel}", message.get("message_id"))
 
-                original = target.read_text(encoding="utf-8")
-                if isinstance(payload.get("content"), str):
-                    updated = str(payload.get("content"))
-                elif isinstance(payload.get("find"), str) and isinstance(payload.get("replace"), str):
-                    updated = original.replace(str(payload["find"]), str(payload["replace"]))
-                else:
-                    return make_error(
-                        "E_BAD_MESSAGE",
-                        "edit requires either content or find+replace",
-                        message.get("message_id"),
-                    )
-
-                target.write_text(updated if updated.endswith("\n") else updated + "\n", encoding="utf-8")
-                self.ctx.persistence.emit_event("workflow", "memory.edit", {"path": rel})
+                with self._library_lock:
+                    original = target.read_text(encoding="utf-8")
+                    if isinstance(payload.get("content"), str):
+                        updated = str(payload.get("content"))
+                    elif isinstance(payload.get("find"), str) and isinstance(payload.get("replace"), str):
+                        updated = original.replace(str(payload["find"]), str(payload["replace"]))
+                    else:
+                        return make_error(
+                            "E_BAD_MESSAGE",
+                            "edit requires either content or find+replace",
+                            message.get("message_id"),
+                        )
+
+                    _write_document(target, updated)
+                    self._invalidate_caches()
+                    self.ctx.persistence.emit_event("workflow", "memory.edit", {"path": rel})
                 return make_response("memory.edit.applied", {"path": rel}, message.get("message_id"))
 
             if intent == "memory.delete.propose":
@@ -200,8 +351,10 @@ class MemoryFsNode(ProtocolNode):
                     return make_error("E_NODE_ERROR", f"File not found: {rel}", message.get("message_id"))
                 if target.is_dir():
                     return make_error("E_NODE_ERROR", "delete file intents cannot delete directories", message.get("message_id"))
-                target.unlink(missing_ok=False)
-                self.ctx.persistence.emit_event("workflow", "memory.delete", {"path": rel})
+                with self._library_lock:
+                    target.unlink(missing_ok=False)
+                    self._invalidate_caches()
+                    self.ctx.persistence.emit_event("workflow", "memory.delete", {"path": rel})
                 return make_response("memory.delete.applied", {"path": rel}, message.get("message_id"))
         except ValueError as exc:
             return make_error("E_BAD_MESSAGE", str(exc), message.get("message_id"))
@@ -1,24 +1,71 @@
 from __future__ import annotations
 
-import json
+import math
+import operator
 import os
 import socket
-from typing import Any, Dict, List
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Tuple
 from urllib import error, request
 
 from ..constants import E_NODE_ERROR, E_NODE_TIMEOUT, E_NODE_UNAVAILABLE, MODEL_PROVIDER_OLLAMA
-from ..protocol import make_error, make_response
+from ..metadata import CapabilityMetadata
+from ..protocol import dumps_json, loads_json, make_error, make_response, normalize_message
 from .base import ProtocolNode, cap
 
+_CHAT_CACHE_SIZE = 256
+_SEMANTIC_CACHE_SIZE = 256
+
+_CAPABILITIES = (
+    cap(
+        name="model.chat.complete",
+        description="Complete chat using Ollama provider",
+        input_schema={"type": "object", "required": ["prompt"]},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["summarize this spec"],
+        idempotency="idempotent",
+        side_effect_scope="external",
+        provider=MODEL_PROVIDER_OLLAMA,
+    ),
+    cap(
+        name="model.chat.stream",
+        description="Stream chat using Ollama provider",
+        input_schema={"type": "object", "required": ["prompt"]},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["stream response"],
+        idempotency="idempotent",
+        side_effect_scope="external",
+        provider=MODEL_PROVIDER_OLLAMA,
+    ),
+    cap(
+        name="model.catalog.list",
+        description="List Ollama models",
+        input_schema={"type": "object"},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["list models"],
+        idempotency="idempotent",
+        side_effect_scope="external",
+        provider=MODEL_PROVIDER_OLLAMA,
+    ),
+)
+
 
 class OllamaModelNode(ProtocolNode):
     node_id = "node.model.ollama"
     priority = 165
-    _FALLBACK_MODELS = [
+    _FALLBACK_MODELS: Tuple[str, ...] = (
         "llama3:8b",
         "mistral:7b",
         "phi3:mini",
-    ]
+    )
 
     def __init__(self, ctx) -> None:
         super().__init__(ctx)
@@ -26,46 +73,31 @@ class OllamaModelNode(ProtocolNode):
         self.base_url = str(source_env.get("BRAINDRIVE_OLLAMA_BASE_URL", "")).rstrip("/")
         self.api_key = str(source_env.get("BRAINDRIVE_OLLAMA_API_KEY", "")).strip()
         self.timeout_sec = self._parse_timeout(str(source_env.get("BRAINDRIVE_MODEL_TIMEOUT_SEC", "30")))
+        # simulate_timeout is a test hook; it is only honoured where test endpoints are enabled.
+        self._test_hooks = str(source_env.get("BRAINDRIVE_ENABLE_TEST_ENDPOINTS", "false")).lower() == "true"
+        # Request copies headers on construction, so one dict serves every call.
+        self._headers = self._build_headers()
+        self._chat_url = self._endpoint("chat/completions")
+        self._models_url = self._endpoint("models")
+        self._embeddings_url = self._endpoint("embeddings")
+        self.cache_ttl_sec = self._parse_cache_ttl(str(source_env.get("BRAINDRIVE_OLLAMA_CACHE_TTL", "3600")), 3600.0)
+        self.catalog_ttl_sec = self._parse_cache_ttl(str(source_env.get("BRAINDRIVE_OLLAMA_CATALOG_TTL", "30")), 30.0)
+        self._catalog_cache: Tuple[float, Tuple[str, ...]] | None = None
+        self._chat_cache: OrderedDict[bytes, Tuple[float, str]] = OrderedDict()
+        self.semantic_cache = str(source_env.get("BRAINDRIVE_OLLAMA_SEMCACHE", "false")).strip().lower() in {"1", "true"}
+        self.semantic_threshold = self._parse_threshold(str(source_env.get("BRAINDRIVE_OLLAMA_SEMCACHE_THRESHOLD", "0.92")))
+        self.embed_model = str(source_env.get("BRAINDRIVE_OLLAMA_EMBED_MODEL", "")).strip() or "nomic-embed-text"
+        self._semantic_entries: Deque[Tuple[bytes, float, Tuple[float, ...], str]] = deque(maxlen=_SEMANTIC_CACHE_SIZE)
+        # node_service handles requests on threads, so the caches are shared between them.
+        self._cache_lock = threading.Lock()
+        self._dispatch = {
+            "model.catalog.list": self._handle_catalog,
+            "model.chat.complete": self._handle_chat,
+            "model.chat.stream": self._handle_chat,
+        }
 
-    def capabilities(self) -> List:
-        return [
-            cap(
-                name="model.chat.complete",
-                description="Complete chat using Ollama provider",
-                input_schema={"type": "object", "required": ["prompt"]},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["summarize this spec"],
-                idempotency="idempotent",
-                side_effect_scope="external",
-                provider=MODEL_PROVIDER_OLLAMA,
-            ),
-            cap(
-                name="model.chat.stream",
-                description="Stream chat using Ollama provider",
-                input_schema={"type": "object", "required": ["prompt"]},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["stream response"],
-                idempotency="idempotent",
-                side_effect_scope="external",
-                provider=MODEL_PROVIDER_OLLAMA,
-            ),
-            cap(
-                name="model.catalog.list",
-                description="List Ollama models",
-                input_schema={"type": "object"},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["list models"],
-                idempotency="idempotent",
-                side_effect_scope="external",
-                provider=MODEL_PROVIDER_OLLAMA,
-            ),
-        ]
+    def capabilities(self) -> Tuple[CapabilityMetadata, ...]:
+        return _CAPABILITIES
 
     @staticmethod
     def _parse_timeout(raw: str) -> float:
@@ -74,6 +106,20 @@ class OllamaModelNode(ProtocolNode):
         except (TypeError, ValueError):
             return 30.0
 
+    @staticmethod
+    def _parse_cache_ttl(raw: str, default: float) -> float:
+        try:
+            return max(0.0, float(raw))
+        except (TypeError, ValueError):
+            return default
+
+    @staticmethod
+    def _parse_threshold(raw: str) -> float:
+        try:
+            return min(1.0, max(0.0, float(raw)))
+        except (TypeError, ValueError):
+            return 0.92
+
     def _llm_info(self, message: Dict[str, Any]) -> Dict[str, Any]:
         llm = (message.get("extensions", {}) or {}).get("llm", {})
         if not isinstance(llm, dict):
@@ -103,18 +149,14 @@ class OllamaModelNode(ProtocolNode):
         self,
         *,
         method: str,
-        path: str,
+        url: str,
         parent_message_id: str | None,
-        payload: Dict[str, Any] | None = None,
+        body: bytes | None = None,
     ) -> tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
-        body = None
-        if payload is not None:
-            body = json.dumps(payload, ensure_ascii=True).encode("utf-8")
-
         req = request.Request(
-            url=self._endpoint(path),
+            url=url,
             data=body,
-            headers=self._build_headers(),
+            headers=self._headers,
             method=method,
         )
         try:
@@ -191,8 +233,8 @@ class OllamaModelNode(ProtocolNode):
             )
 
         try:
-            parsed = json.loads(raw.decode("utf-8"))
-        except json.JSONDecodeError:
+            parsed = loads_json(raw)
+        except ValueError:
             return None, make_error(
                 E_NODE_ERROR,
                 "Ollama returned invalid JSON.",
@@ -242,6 +284,44 @@ class OllamaModelNode(ProtocolNode):
         delta = first.get("delta") if isinstance(first.get("delta"), dict) else {}
         return self._content_to_text(delta.get("content"))
 
+    def _embed(self, text: str, parent_message_id: str | None) -> Tuple[float, ...] | None:
+        response_body, err = self._request_json(
+            method="POST",
+            url=self._embeddings_url,
+            parent_message_id=parent_message_id,
+            body=dumps_json({"model": self.embed_model, "input": text}),
+        )
+        if err or response_body is None:
+            return None
+        data = response_body.get("data")
+        if not isinstance(data, list) or not data or not isinstance(data[0], dict):
+            return None
+        raw_vector = data[0].get("embedding")
+        if not isinstance(raw_vector, list) or not raw_vector:
+            return None
+        try:
+            vector = [float(value) for value in raw_vector]
+        except (TypeError, ValueError):
+            return None
+        norm = math.sqrt(sum(value * value for value in vector))
+        if not norm:
+            return None
+        return tuple(value / norm for value in vector)
+
+    def _semantic_lookup(self, params_key: bytes, vector: Tuple[float, ...]) -> str | None:
+        # Vectors are stored unit-length, so the dot product is the cosine similarity.
+        now = time.monotonic()
+        best_score = self.semantic_threshold
+        best_text = None
+        for key, expires_at, other, text in self._semantic_entries:
+            if key != params_key or expires_at <= now or len(other) != len(vector):
+                continue
+            score = sum(map(operator.mul, vector, other))
+            if score >= best_score:
+                best_score = score
+                best_text = text
+        return best_text
+
     def _chat_completion(
         self,
         *,
@@ -269,11 +349,34 @@ class OllamaModelNode(ProtocolNode):
             if stops:
                 body["stop"] = stops
 
+        encoded = dumps_json(body)
+        # Only an explicit temperature of 0 makes a completion repeatable; sampled
+        # completions and the server's default temperature are never cached. The
+        # encoded body is both the cache key and the request data.
+        cache_key = encoded if self.cache_ttl_sec and body.get("temperature") == 0.0 else None
+        if cache_key is not None:
+            with self._cache_lock:
+                cached = self._chat_cache.get(cache_key)
+                if cached is not None and cached[0] > time.monotonic():
+                    self._chat_cache.move_to_end(cache_key)
+                    return cached[1], None
+
+        semantic_key = None
+        vector = None
+        if cache_key is not None and self.semantic_cache:
+            semantic_key = dumps_json({key: value for key, value in body.items() if key != "messages"})
+            vector = self._embed(prompt, parent_message_id)
+            if vector is not None:
+                with self._cache_lock:
+                    similar = self._semantic_lookup(semantic_key, vector)
+                if similar is not None:
+                    return similar, None
+
         response_body, err = self._request_json(
             method="POST",
-            path="/chat/completions",
+            url=self._chat_url,
             parent_message_id=parent_message_id,
-            payload=body,
+            body=encoded,
         )
         if err:
             return None, err
@@ -287,14 +390,30 @@ class OllamaModelNode(ProtocolNode):
                 retryable=False,
                 details={"provider": MODEL_PROVIDER_OLLAMA},
             )
+
+        with self._cache_lock:
+            if cache_key is not None:
+                self._chat_cache[cache_key] = (time.monotonic() + self.cache_ttl_sec, text)
+                self._chat_cache.move_to_end(cache_key)
+                if len(self._chat_cache) > _CHAT_CACHE_SIZE:
+                    self._chat_cache.popitem(last=False)
+            if semantic_key is not None and vector is not None:
+                self._semantic_entries.append((semantic_key, time.monotonic() + self.cache_ttl_sec, vector, text))
         return text, None
 
-    def _catalog(self, parent_message_id: str | None) -> Dict[str, Any]:
+    def _catalog(self, parent_message_id: str | None, refresh: bool = False) -> Dict[str, Any]:
+        cached = self._catalog_cache
+        if not refresh and cached is not None and cached[0] > time.monotonic():
+            return make_response(
+                "model.catalog",
+                {"provider": MODEL_PROVIDER_OLLAMA, "models": list(cached[1]), "fallback": False},
+                parent_message_id,
+            )
+
         response_body, err = self._request_json(
             method="GET",
-            path="/models",
+            url=self._models_url,
             parent_message_id=parent_message_id,
-            payload=None,
         )
         models: List[str] = []
         if response_body is not None:
@@ -307,10 +426,11 @@ class OllamaModelNode(ProtocolNode):
                     if isinstance(model_id, str) and model_id.strip():
                         models.append(model_id.strip())
 
-        if not models:
-            models = list(self._FALLBACK_MODELS)
-        else:
-            models = sorted(set(models))
+        # The fallback is only copied when it is actually returned.
+        models = sorted(set(models)) if models else list(self._FALLBACK_MODELS)
+        # Only a successful listing is reused; fallback answers retry the provider next time.
+        if err is None and self.catalog_ttl_sec:
+            self._catalog_cache = (time.monotonic() + self.catalog_ttl_sec, tuple(models))
 
         return make_response(
             "model.catalog",
@@ -322,51 +442,52 @@ class OllamaModelNode(ProtocolNode):
             parent_message_id,
         )
 
-    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        intent = message.get("intent")
-        payload = message.get("payload", {})
-        if not isinstance(payload, dict):
-            return make_error("E_BAD_MESSAGE", "payload must be object", message.get("message_id"))
+    def _handle_catalog(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        return self._catalog(message_id, refresh=bool(payload.get("refresh")))
 
+    def _handle_chat(self, message: Dict[str, Any], payload: Dict[str, Any], message_id: Any) -> Dict[str, Any]:
+        prompt = str(payload.get("prompt", "")).strip()
+        if not prompt:
+            return make_error("E_BAD_MESSAGE", "prompt is required", message_id)
         llm = self._llm_info(message)
         model = str(llm.get("model", "")).strip()
         provider = str(llm.get("provider", "")).strip() or MODEL_PROVIDER_OLLAMA
+        text, err = self._chat_completion(
+            model=model,
+            prompt=prompt,
+            llm=llm,
+            parent_message_id=message_id,
+        )
+        if err:
+            return err
+        assert text is not None
+        response_intent = "model.chat.stream.chunk" if message.get("intent") == "model.chat.stream" else "model.chat.completed"
+        return make_response(
+            response_intent,
+            {
+                "provider": provider,
+                "model": model,
+                "text": text,
+            },
+            message_id,
+        )
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        intent, payload, message_id = normalize_message(message)
+        if payload is None:
+            return make_error("E_BAD_MESSAGE", "payload must be object", message_id)
 
-        if payload.get("simulate_timeout"):
-            return make_error(E_NODE_TIMEOUT, "Request timed out. You can retry.", message.get("message_id"), retryable=True)
+        if self._test_hooks and payload.get("simulate_timeout"):
+            return make_error(E_NODE_TIMEOUT, "Request timed out. You can retry.", message_id, retryable=True)
 
         if not self.base_url:
             return make_error(
                 E_NODE_UNAVAILABLE,
                 "BRAINDRIVE_OLLAMA_BASE_URL is required for provider ollama",
-                message.get("message_id"),
-            )
-
-        if intent == "model.catalog.list":
-            return self._catalog(message.get("message_id"))
-
-        if intent in {"model.chat.complete", "model.chat.stream"}:
-            prompt = str(payload.get("prompt", "")).strip()
-            if not prompt:
-                return make_error("E_BAD_MESSAGE", "prompt is required", message.get("message_id"))
-            text, err = self._chat_completion(
-                model=model,
-                prompt=prompt,
-                llm=llm,
-                parent_message_id=message.get("message_id"),
-            )
-            if err:
-                return err
-            assert text is not None
-            response_intent = "model.chat.stream.chunk" if intent == "model.chat.stream" else "model.chat.completed"
-            return make_response(
-                response_intent,
-                {
-                    "provider": provider,
-                    "model": model,
-                    "text": text,
-                },
-                message.get("message_id"),
+                message_id,
             )
 
-        return make_error("E_NO_ROUTE", "Unsupported intent", message.get("message_id"))
+        handler = self._dispatch.get(intent)
+        if handler is None:
+            return make_error("E_NO_ROUTE", "Unsupported intent", message_id)
+        return handler(message, payload, message_id)
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import json
 import os
 import socket
 from typing import Any, Dict, List
 from urllib import error, request
 
 from ..constants import E_NODE_ERROR, E_NODE_TIMEOUT, E_NODE_UNAVAILABLE, MODEL_PROVIDER_OPENROUTER
-from ..protocol import make_error, make_response
+from ..protocol import dumps_json, loads_json, make_error, make_response
 from .base import ProtocolNode, cap
 
 
@@ -28,6 +27,12 @@ class OpenRouterModelNode(ProtocolNode):
         self.site_url = str(source_env.get("BRAINDRIVE_OPENROUTER_SITE_URL", "")).strip()
         self.app_name = str(source_env.get("BRAINDRIVE_OPENROUTER_APP_NAME", "BrainDrive-MVP")).strip()
         self.timeout_sec = self._parse_timeout(str(source_env.get("BRAINDRIVE_MODEL_TIMEOUT_SEC", "30")))
+        # simulate_timeout is a test hook; it is only honoured where test endpoints are enabled.
+        self._test_hooks = str(source_env.get("BRAINDRIVE_ENABLE_TEST_ENDPOINTS", "false")).lower() == "true"
+        # Request copies headers on construction, so one dict serves every call.
+        self._headers = self._build_headers()
+        self._chat_url = self._endpoint("chat/completions")
+        self._models_url = self._endpoint("models")
 
     def capabilities(self) -> List:
         return [
@@ -109,18 +114,18 @@ class OpenRouterModelNode(ProtocolNode):
         self,
         *,
         method: str,
-        path: str,
+        url: str,
         parent_message_id: str | None,
         payload: Dict[str, Any] | None = None,
     ) -> tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
         body = None
         if payload is not None:
-            body = json.dumps(payload, ensure_ascii=True).encode("utf-8")
+            body = dumps_json(payload)
 
         req = request.Request(
-            url=self._endpoint(path),
+            url=url,
             data=body,
-            headers=self._build_headers(),
+            headers=self._headers,
             method=method,
         )
         try:
@@ -188,8 +193,8 @@ class OpenRouterModelNode(ProtocolNode):
             )
 
         try:
-            parsed = json.loads(raw.decode("utf-8"))
-        except json.JSONDecodeError:
+            parsed = loads_json(raw)
+        except ValueError:
             return None, make_error(
                 E_NODE_ERROR,
                 "OpenRouter returned invalid JSON.",
@@ -268,7 +273,7 @@ class OpenRouterModelNode(ProtocolNode):
 
         response_body, err = self._request_json(
             method="POST",
-            path="/chat/completions",
+            url=self._chat_url,
             parent_message_id=parent_message_id,
             payload=body,
         )
@@ -289,7 +294,7 @@ class OpenRouterModelNode(ProtocolNode):
     def _catalog(self, parent_message_id: str | None) -> Dict[str, Any]:
         response_body, err = self._request_json(
             method="GET",
-            path="/models",
+            url=self._models_url,
             parent_message_id=parent_message_id,
             payload=None,
         )
@@ -329,7 +334,7 @@ class OpenRouterModelNode(ProtocolNode):
         model = str(llm.get("model", "")).strip()
         provider = str(llm.get("provider", "")).strip() or MODEL_PROVIDER_OPENROUTER
 
-        if payload.get("simulate_timeout"):
+        if self._test_hooks and payload.get("simulate_timeout"):
             return make_error(E_NODE_TIMEOUT, "Request timed out. You can retry.", message.get("message_id"), retryable=True)
 
         if not self.api_key:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+from ..metadata import CapabilityMetadata
 from ..protocol import make_error, make_response
 from .base import ProtocolNode, cap
 
@@ -66,58 +67,73 @@ SKILL_TEMPLATES = {
     "plan-generation/prompts/propose-save.md": "# Plan Generation Skill\n\nGenerate a phased plan from spec.md.\n",
 }
 
+# Encoded once at import; parents sorted so each directory follows its own parent.
+_SKILL_BLOBS = tuple((filename, content.encode("utf-8")) for filename, content in SKILL_TEMPLATES.items())
+_SKILL_PARENTS = tuple(sorted({os.path.dirname(filename) for filename in SKILL_TEMPLATES} - {""}))
+
+_CAPABILITIES = (
+    cap(
+        name="system.bootstrap",
+        description="Initialize runtime prerequisites and skill files",
+        input_schema={"type": "object"},
+        risk_class="mutate",
+        required_extensions=[],
+        approval_required=False,
+        examples=["bootstrap system"],
+        idempotency="idempotent",
+        side_effect_scope="file",
+    ),
+    cap(
+        name="system.health.check",
+        description="Return runtime health",
+        input_schema={"type": "object"},
+        risk_class="read",
+        required_extensions=[],
+        approval_required=False,
+        examples=["health check"],
+        idempotency="idempotent",
+        side_effect_scope="none",
+    ),
+)
+
 
 class RuntimeBootstrapNode(ProtocolNode):
     node_id = "node.runtime.bootstrap"
     priority = 150
 
-    def capabilities(self) -> List:
-        return [
-            cap(
-                name="system.bootstrap",
-                description="Initialize runtime prerequisites and skill files",
-                input_schema={"type": "object"},
-                risk_class="mutate",
-                required_extensions=[],
-                approval_required=False,
-                examples=["bootstrap system"],
-                idempotency="idempotent",
-                side_effect_scope="file",
-            ),
-            cap(
-                name="system.health.check",
-                description="Return runtime health",
-                input_schema={"type": "object"},
-                risk_class="read",
-                required_extensions=[],
-                approval_required=False,
-                examples=["health check"],
-                idempotency="idempotent",
-                side_effect_scope="none",
-            ),
-        ]
+    def capabilities(self) -> Tuple[CapabilityMetadata, ...]:
+        return _CAPABILITIES
 
     def _ensure_skills(self) -> Dict[str, List[str]]:
         skills_dir = self.ctx.library_root / ".braindrive" / "skills"
         skills_dir.mkdir(parents=True, exist_ok=True)
 
+        for parent in _SKILL_PARENTS:
+            (skills_dir / parent).mkdir(exist_ok=True)
+
         created: List[str] = []
         existing: List[str] = []
-        for filename, content in SKILL_TEMPLATES.items():
-            target = skills_dir / filename
-            target.parent.mkdir(parents=True, exist_ok=True)
-            if target.exists():
+        for filename, blob in _SKILL_BLOBS:
+            # Exclusive create tests for presence and writes in one open(); an existing
+            # file is never overwritten, even if it appears after the bootstrap starts.
+            try:
+                with open(skills_dir / filename, "xb") as handle:
+                    handle.write(blob)
+            except FileExistsError:
                 existing.append(filename)
                 continue
-            target.write_text(content, encoding="utf-8")
             created.append(filename)
         return {"created": created, "existing": existing}
 
     def _is_writable(self, path: Path) -> bool:
+        # access() rejects read-only mounts without touching disk; creating the probe
+        # confirms the rest (ACLs and network filesystems can report access() wrongly).
+        if not os.access(path, os.W_OK):
+            return False
+        probe = os.path.join(path, ".bdp-write-probe")
         try:
-            probe = path / ".bdp-write-probe"
-            probe.write_text("ok", encoding="utf-8")
-            probe.unlink(missing_ok=True)
+            os.close(os.open(probe, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600))
+            os.unlink(probe)
             return True
         except OSError:
             return False
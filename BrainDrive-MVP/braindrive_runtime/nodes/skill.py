@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import time
 from pathlib import Path
@@ -25,6 +26,40 @@ LEGACY_INTENT_MAP: Dict[str, Dict[str, str]] = {
 }
 
 
+# (skill dir name, skill.yaml st_mtime_ns, st_size) per manifest, plus the legacy *.md names.
+_SkillsFingerprint = Tuple[Tuple[Tuple[str, int, int], ...], Tuple[str, ...]]
+
+_HISTORY_PROBE_BYTES = 4096
+
+_SKILL_ID_RE = re.compile(r"^\s*skill_id\s*:\s*([A-Za-z0-9_-]+)\s*$", re.MULTILINE)
+_ACTIONS_HEADER_RE = re.compile(r"^\s*actions\s*:\s*$")
+_TOPLEVEL_RE = re.compile(r"^[A-Za-z0-9_-]")
+_ACTION_NAME_RE = re.compile(r"^\s{2}([A-Za-z0-9_-]+)\s*:\s*$")
+_TIER_RE = re.compile(r"^\s{4}execution_tier\s*:\s*([A-Za-z0-9_-]+)\s*$")
+_PROMPT_RE = re.compile(r"^\s{4}prompt_template\s*:\s*(.+?)\s*$")
+
+
+def _child_dict(parent: Dict[str, Any], key: str) -> Dict[str, Any]:
+    child = parent.get(key)
+    if not isinstance(child, dict):
+        child = parent[key] = {}
+    return child
+
+
+def _has_text(path: Path) -> bool:
+    # Same answer as bool(path.read_text().strip()), usually from the first block alone.
+    try:
+        with path.open("rb") as handle:
+            head = handle.read(_HISTORY_PROBE_BYTES)
+            if head.decode("utf-8", errors="ignore").strip():
+                return True
+            if len(head) < _HISTORY_PROBE_BYTES:
+                return False
+            return bool((head + handle.read()).decode("utf-8").strip())
+    except (FileNotFoundError, IsADirectoryError):
+        return False
+
+
 class SkillWorkflowNode(ProtocolNode):
     node_id = "node.workflow.skill"
     priority = 140
@@ -35,8 +70,16 @@ class SkillWorkflowNode(ProtocolNode):
         user_config_path_raw = str(source_env.get("BRAINDRIVE_USER_CONFIG_PATH", "")).strip()
         user_config_path = Path(user_config_path_raw) if user_config_path_raw else None
         self._config = ConfigResolver(env=source_env, user_config_path=user_config_path)
+        self._skills_path = self.ctx.library_root / ".braindrive" / "skills"
+        self._skills_root: Path | None = None
         self._catalog_cache: Dict[str, Dict[str, Any]] = {}
-        self._catalog_fingerprint: Tuple[Tuple[str, int, int], ...] = tuple()
+        self._catalog_fingerprint: _SkillsFingerprint = ((), ())
+        # Parsed skill.yaml files keyed by skill dir name -> ((st_mtime_ns, st_size), parsed).
+        self._manifest_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # Manifest skill_id -> skill dir name, plus the skills dir mtime at the last catalog check,
+        # so _resolve_action can revalidate one skill without scanning the tree.
+        self._manifest_dirs: Dict[str, str] = {}
+        self._skills_root_mtime_ns = -1
 
     def capabilities(self) -> List:
         return [
@@ -176,21 +219,35 @@ class SkillWorkflowNode(ProtocolNode):
         ]
 
     def _skills_dir(self) -> Path:
-        return self.ctx.library_root / ".braindrive" / "skills"
-
-    def _skills_fingerprint(self) -> Tuple[Tuple[str, int, int], ...]:
-        root = self._skills_dir()
-        if not root.exists():
-            return tuple()
-
-        items: List[Tuple[str, int, int]] = []
-        for path in sorted(root.rglob("*")):
-            if not path.is_file():
-                continue
-            stat = path.stat()
-            rel = str(path.relative_to(root)).replace("\\", "/")
-            items.append((rel, int(stat.st_mtime_ns), int(stat.st_size)))
-        return tuple(items)
+        return self._skills_path
+
+    def _resolved_skills_dir(self) -> Path:
+        # Resolved on first prompt load, once bootstrap has created the skills directory.
+        if self._skills_root is None:
+            self._skills_root = self._skills_path.resolve()
+        return self._skills_root
+
+    def _skills_fingerprint(self) -> _SkillsFingerprint:
+        # The catalog is built only from */skill.yaml and the names of top-level *.md files,
+        # so prompt files and legacy markdown contents are not stat'ed.
+        manifests: List[Tuple[str, int, int]] = []
+        legacy: List[str] = []
+        try:
+            with os.scandir(self._skills_dir()) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md"):
+                        legacy.append(entry.name)
+                    if entry.is_dir():
+                        try:
+                            stat = os.stat(os.path.join(entry.path, "skill.yaml"))
+                        except OSError:
+                            continue
+                        manifests.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            pass
+        manifests.sort()
+        legacy.sort()
+        return tuple(manifests), tuple(legacy)
 
     def _parse_manifest(self, manifest_path: Path) -> Dict[str, Any]:
         try:
@@ -198,7 +255,7 @@ class SkillWorkflowNode(ProtocolNode):
         except OSError:
             return {}
 
-        skill_match = re.search(r"^\s*skill_id\s*:\s*([A-Za-z0-9_-]+)\s*$", raw, flags=re.MULTILINE)
+        skill_match = _SKILL_ID_RE.search(raw)
         if not skill_match:
             return {}
 
@@ -209,14 +266,14 @@ class SkillWorkflowNode(ProtocolNode):
 
         for line in lines:
             if not in_actions:
-                if re.match(r"^\s*actions\s*:\s*$", line):
+                if _ACTIONS_HEADER_RE.match(line):
                     in_actions = True
                 continue
 
-            if re.match(r"^[A-Za-z0-9_-]", line):
+            if _TOPLEVEL_RE.match(line):
                 break
 
-            action_match = re.match(r"^\s{2}([A-Za-z0-9_-]+)\s*:\s*$", line)
+            action_match = _ACTION_NAME_RE.match(line)
             if action_match:
                 current_action = action_match.group(1)
                 actions[current_action] = {
@@ -228,12 +285,12 @@ class SkillWorkflowNode(ProtocolNode):
             if not current_action:
                 continue
 
-            tier_match = re.match(r"^\s{4}execution_tier\s*:\s*([A-Za-z0-9_-]+)\s*$", line)
+            tier_match = _TIER_RE.match(line)
             if tier_match:
                 actions[current_action]["execution_tier"] = tier_match.group(1).strip()
                 continue
 
-            prompt_match = re.match(r"^\s{4}prompt_template\s*:\s*(.+?)\s*$", line)
+            prompt_match = _PROMPT_RE.match(line)
             if prompt_match:
                 actions[current_action]["prompt_template"] = prompt_match.group(1).strip().strip('"').strip("'")
                 continue
@@ -278,24 +335,38 @@ class SkillWorkflowNode(ProtocolNode):
         root = self._skills_dir()
         root.mkdir(parents=True, exist_ok=True)
 
+        # Stat'ed before the scan, so an entry added mid-scan fails the next fast-path check.
+        self._skills_root_mtime_ns = root.stat().st_mtime_ns
         fingerprint = self._skills_fingerprint()
         if fingerprint == self._catalog_fingerprint:
             return self._catalog_cache
 
         catalog: Dict[str, Dict[str, Any]] = {}
-
-        for manifest in sorted(root.glob("*/skill.yaml")):
-            parsed = self._parse_manifest(manifest)
+        manifest_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        manifest_dirs: Dict[str, str] = {}
+        manifests, legacy_names = fingerprint
+
+        for dirname, mtime_ns, size in manifests:
+            # Only manifests whose stamp changed since the last build are re-parsed.
+            stamp = (mtime_ns, size)
+            cached = self._manifest_cache.get(dirname)
+            if cached is not None and cached[0] == stamp:
+                parsed = cached[1]
+            else:
+                parsed = self._parse_manifest(root / dirname / "skill.yaml")
+            manifest_cache[dirname] = (stamp, parsed)
             if not parsed:
                 continue
+            # Legacy markdown merges actions into the entry below, so the cached parse is not shared.
+            parsed = dict(parsed, actions=dict(parsed["actions"]))
             skill_id = str(parsed.get("skill_id", "")).strip()
             if not skill_id:
                 continue
             catalog[skill_id] = parsed
+            manifest_dirs[skill_id] = dirname
 
-        for legacy in sorted(root.glob("*.md")):
-            filename = legacy.name
-            skill_id = legacy.stem
+        for filename in legacy_names:
+            skill_id = os.path.splitext(filename)[0]
             item = catalog.setdefault(
                 skill_id,
                 {
@@ -314,6 +385,8 @@ class SkillWorkflowNode(ProtocolNode):
 
         self._catalog_cache = catalog
         self._catalog_fingerprint = fingerprint
+        self._manifest_cache = manifest_cache
+        self._manifest_dirs = manifest_dirs
 
         self.ctx.persistence.emit_event(
             "workflow",
@@ -328,17 +401,18 @@ class SkillWorkflowNode(ProtocolNode):
     def _catalog_payload(self) -> Dict[str, Any]:
         catalog = self._load_catalog()
         out: List[Dict[str, Any]] = []
-        for skill_id in sorted(catalog.keys()):
+        for skill_id in sorted(catalog):
             entry = catalog[skill_id]
-            actions = entry.get("actions", {}) if isinstance(entry.get("actions"), dict) else {}
-            action_names = sorted(actions.keys())
-            tiers = sorted({str(actions[name].get("execution_tier", "read")) for name in action_names if name in actions})
+            actions = entry.get("actions")
+            if not isinstance(actions, dict):
+                actions = {}
+            tiers = {str(meta.get("execution_tier", "read")) for meta in actions.values()}
             out.append(
                 {
                     "skill_id": skill_id,
                     "source": str(entry.get("source", "unknown")),
-                    "actions": action_names,
-                    "execution_tiers": tiers,
+                    "actions": sorted(actions),
+                    "execution_tiers": sorted(tiers),
                 }
             )
         return {
@@ -347,9 +421,29 @@ class SkillWorkflowNode(ProtocolNode):
             "skills_dir": str(self._skills_dir()),
         }
 
+    def _cached_skill(self, skill_id: str) -> Dict[str, Any] | None:
+        # Adding, removing or renaming a skill bumps the skills dir mtime, so an unchanged dir and
+        # skill.yaml keep the cached entry current. Not caught: another manifest being edited in
+        # place to claim the same skill_id.
+        dirname = self._manifest_dirs.get(skill_id)
+        if dirname is None:
+            return None
+        root = self._skills_dir()
+        try:
+            root_mtime_ns = os.stat(root).st_mtime_ns
+            stat = os.stat(os.path.join(root, dirname, "skill.yaml"))
+        except OSError:
+            return None
+        if root_mtime_ns != self._skills_root_mtime_ns:
+            return None
+        if (stat.st_mtime_ns, stat.st_size) != self._manifest_cache[dirname][0]:
+            return None
+        return self._catalog_cache.get(skill_id)
+
     def _resolve_action(self, skill_id: str, action: str, parent_message_id: str | None) -> Tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
-        catalog = self._load_catalog()
-        skill = catalog.get(skill_id)
+        skill = self._cached_skill(skill_id)
+        if skill is None:
+            skill = self._load_catalog().get(skill_id)
         if not isinstance(skill, dict):
             return None, make_error("E_NODE_ERROR", f"Unknown skill_id: {skill_id}", parent_message_id)
 
@@ -392,10 +486,7 @@ class SkillWorkflowNode(ProtocolNode):
                 prompt_file = f"{resolved['skill_id']}.md"
             prompt_path = (self._skills_dir() / prompt_file).resolve()
 
-        skills_root = self._skills_dir().resolve()
-        try:
-            prompt_path.relative_to(skills_root)
-        except ValueError:
+        if not prompt_path.is_relative_to(self._resolved_skills_dir()):
             return None, make_error(
                 "E_NODE_ERROR",
                 "Skill prompt path escapes skills directory",
@@ -489,33 +580,30 @@ class SkillWorkflowNode(ProtocolNode):
             return {"status": "idle", "answers": [], "question_index": 0, "asked_questions": []}
         return item
 
-    def _save_interview(self, folder: str, interview: Dict[str, Any]) -> None:
-        if self.ctx.workflow_state is None:
-            return
-
-        def _mutate(state: Dict[str, Any]) -> None:
-            interviews = state.setdefault("interviews", {})
-            if not isinstance(interviews, dict):
-                state["interviews"] = {}
-                interviews = state["interviews"]
-            interviews[folder] = interview
-
-        self.ctx.workflow_state.mutate(_mutate)
-
-    def _save_skill_session(self, *, skill_id: str, folder: str, session: Dict[str, Any]) -> None:
+    def _save_interview_step(
+        self,
+        folder: str,
+        interview: Dict[str, Any],
+        output: Dict[str, Any],
+        *,
+        completed: bool = False,
+    ) -> None:
+        # The interview, its skill session and output, and on completion the history
+        # entry are applied in one mutate: one state reload and one save per step.
         if self.ctx.workflow_state is None:
             return
+        history_entry = self._interview_history_entry(interview) if completed else None
 
         def _mutate(state: Dict[str, Any]) -> None:
-            sessions = state.setdefault("skill_sessions", {})
-            if not isinstance(sessions, dict):
-                state["skill_sessions"] = {}
-                sessions = state["skill_sessions"]
-            by_skill = sessions.setdefault(skill_id, {})
-            if not isinstance(by_skill, dict):
-                sessions[skill_id] = {}
-                by_skill = sessions[skill_id]
-            by_skill[folder] = session
+            _child_dict(state, "interviews")[folder] = interview
+            _child_dict(_child_dict(state, "skill_sessions"), "interview")[folder] = interview
+            _child_dict(_child_dict(state, "skill_outputs"), "interview")[folder] = output
+            if history_entry is not None:
+                history = _child_dict(state, "interview_history")
+                entries = history.get(folder)
+                if not isinstance(entries, list):
+                    entries = history[folder] = []
+                entries.append(history_entry)
 
         self.ctx.workflow_state.mutate(_mutate)
 
@@ -524,15 +612,7 @@ class SkillWorkflowNode(ProtocolNode):
             return
 
         def _mutate(state: Dict[str, Any]) -> None:
-            outputs = state.setdefault("skill_outputs", {})
-            if not isinstance(outputs, dict):
-                state["skill_outputs"] = {}
-                outputs = state["skill_outputs"]
-            by_skill = outputs.setdefault(skill_id, {})
-            if not isinstance(by_skill, dict):
-                outputs[skill_id] = {}
-                by_skill = outputs[skill_id]
-            by_skill[folder] = output
+            _child_dict(_child_dict(state, "skill_outputs"), skill_id)[folder] = output
 
         self.ctx.workflow_state.mutate(_mutate)
 
@@ -541,10 +621,6 @@ class SkillWorkflowNode(ProtocolNode):
         if not log_path.parent.exists():
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        existing = ""
-        if log_path.exists() and log_path.is_file():
-            existing = log_path.read_text(encoding="utf-8")
-
         answers = interview.get("answers", [])
         if not isinstance(answers, list):
             answers = []
@@ -554,7 +630,7 @@ class SkillWorkflowNode(ProtocolNode):
         folder_title = folder.replace("-", " ")
 
         lines: List[str] = []
-        if not existing.strip():
+        if not _has_text(log_path):
             lines.append(f"# {folder_title} Interview History")
             lines.append("")
 
@@ -588,10 +664,9 @@ class SkillWorkflowNode(ProtocolNode):
         with log_path.open("a", encoding="utf-8") as handle:
             handle.write("\n".join(lines))
 
-    def _save_interview_history_entry(self, folder: str, interview: Dict[str, Any]) -> None:
-        if self.ctx.workflow_state is None:
-            return
-        session = {
+    @staticmethod
+    def _interview_history_entry(interview: Dict[str, Any]) -> Dict[str, Any]:
+        return {
             "session_id": str(interview.get("session_id", "")).strip(),
             "started_at": str(interview.get("started_at", "")).strip(),
             "completed_at": str(interview.get("completed_at", "")).strip(),
@@ -599,19 +674,6 @@ class SkillWorkflowNode(ProtocolNode):
             "summary": str(interview.get("summary", "")).strip(),
         }
 
-        def _mutate(state: Dict[str, Any]) -> None:
-            history = state.setdefault("interview_history", {})
-            if not isinstance(history, dict):
-                state["interview_history"] = {}
-                history = state["interview_history"]
-            entries = history.setdefault(folder, [])
-            if not isinstance(entries, list):
-                history[folder] = []
-                entries = history[folder]
-            entries.append(session)
-
-        self.ctx.workflow_state.mutate(_mutate)
-
     @staticmethod
     def _first_question_line(text: str) -> str:
         for line in text.splitlines():
@@ -786,9 +848,7 @@ class SkillWorkflowNode(ProtocolNode):
             return make_error("E_NODE_ERROR", "Model did not return interview question", message.get("message_id"))
 
         interview["asked_questions"] = [question]
-        self._save_interview(folder, interview)
-        self._save_skill_session(skill_id="interview", folder=folder, session=interview)
-        self._save_skill_output(skill_id="interview", folder=folder, output={"question": question, "question_index": 0})
+        self._save_interview_step(folder, interview, {"question": question, "question_index": 0})
 
         return (
             "workflow.interview.question",
@@ -832,12 +892,10 @@ class SkillWorkflowNode(ProtocolNode):
 
         if len(answers) >= MIN_INTERVIEW_ANSWERS:
             interview["status"] = "ready_to_complete"
-            self._save_interview(folder, interview)
-            self._save_skill_session(skill_id="interview", folder=folder, session=interview)
-            self._save_skill_output(
-                skill_id="interview",
-                folder=folder,
-                output={
+            self._save_interview_step(
+                folder,
+                interview,
+                {
                     "answers_collected": len(answers),
                     "next": "workflow.interview.complete",
                 },
@@ -865,12 +923,10 @@ class SkillWorkflowNode(ProtocolNode):
         if not question:
             return make_error("E_NODE_ERROR", "Model did not return interview question", message.get("message_id"))
         asked_questions.append(question)
-        self._save_interview(folder, interview)
-        self._save_skill_session(skill_id="interview", folder=folder, session=interview)
-        self._save_skill_output(
-            skill_id="interview",
-            folder=folder,
-            output={
+        self._save_interview_step(
+            folder,
+            interview,
+            {
                 "question": question,
                 "answers_collected": len(answers),
                 "question_index": int(interview.get("question_index", 0)),
@@ -925,19 +981,17 @@ class SkillWorkflowNode(ProtocolNode):
         except OSError as exc:
             return make_error("E_NODE_ERROR", f"Failed to persist interview history: {exc}", message.get("message_id"))
 
-        self._save_interview(folder, interview)
-        self._save_interview_history_entry(folder, interview)
-        self._save_skill_session(skill_id="interview", folder=folder, session=interview)
-        self._save_skill_output(
-            skill_id="interview",
-            folder=folder,
-            output={
+        self._save_interview_step(
+            folder,
+            interview,
+            {
                 "summary": summary or "",
                 "history_path": f"{folder}/interview.md",
                 "answers_collected": len([item for item in answers if isinstance(item, dict)]),
                 "session_id": str(interview.get("session_id", "")),
                 "completed_at": str(interview.get("completed_at", "")),
             },
+            completed=True,
         )
 
         return (
@@ -1133,8 +1187,8 @@ class SkillWorkflowNode(ProtocolNode):
             f"Execute skill '{skill_id}' action '{action}'.\n"
             "Return concise markdown or plain text output matching the action intent.\n\n"
             f"Active folder: {folder or '(none)'}\n"
-            f"Inputs JSON:\n{json.dumps(inputs, ensure_ascii=True, indent=2)}\n\n"
-            f"Context JSON:\n{json.dumps(context, ensure_ascii=True, indent=2)}\n"
+            f"Inputs JSON:\n{json.dumps(inputs, ensure_ascii=False, indent=2)}\n\n"
+            f"Context JSON:\n{json.dumps(context, ensure_ascii=False, indent=2)}\n"
         )
         text, err = driver.complete(
             prompt=assembled_prompt,
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 
-from .protocol import now_iso
+from .protocol import dumps_json, loads_json, now_iso
 
 SENSITIVE_KEYS = {"api_key", "authorization", "token", "secret"}
 
@@ -24,11 +23,29 @@ class Persistence:
     def state_path(self, name: str) -> Path:
         return self.state_dir / f"{name}.json"
 
+    def journal_path(self, name: str) -> Path:
+        return self.state_dir / f"{name}.journal.jsonl"
+
     def append_log(self, name: str, item: Dict[str, Any]) -> None:
         path = self.log_path(name)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(_scrub_sensitive(item), ensure_ascii=True) + "\n")
+        with path.open("ab") as handle:
+            handle.write(dumps_json(_scrub_sensitive(item)) + b"\n")
+
+    def append_logs(self, name: str, items: Iterable[Dict[str, Any]]) -> None:
+        data = b"".join(dumps_json(_scrub_sensitive(item)) + b"\n" for item in items)
+        if not data:
+            return
+        path = self.log_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as handle:
+            handle.write(data)
+
+    def emit_events(self, channel: str, events: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        self.append_logs(
+            channel,
+            ({"ts": ts, "event_type": event_type, "payload": payload} for ts, event_type, payload in events),
+        )
 
     def emit_event(self, channel: str, event_type: str, payload: Dict[str, Any]) -> None:
         self.append_log(
@@ -41,20 +58,40 @@ class Persistence:
         )
 
     def load_state(self, name: str, default: Any) -> Any:
-        path = self.state_path(name)
-        if not path.exists():
-            return default
         try:
-            raw = path.read_text(encoding="utf-8")
-            return json.loads(raw)
-        except (OSError, json.JSONDecodeError):
+            return loads_json(self.state_path(name).read_bytes())
+        except (OSError, ValueError):
             return default
 
+    def append_journal(self, name: str, entry: Dict[str, Any]) -> None:
+        with self.journal_path(name).open("ab") as handle:
+            handle.write(dumps_json(_scrub_sensitive(entry)) + b"\n")
+
+    def load_journal(self, name: str) -> List[Any]:
+        try:
+            raw = self.journal_path(name).read_bytes()
+        except OSError:
+            return []
+        entries: List[Any] = []
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(loads_json(line))
+            except ValueError:
+                # A crash mid-append can leave a torn final line.
+                continue
+        return entries
+
+    def compact_journal(self, name: str, value: Any) -> None:
+        self.save_state(name, value)
+        self.journal_path(name).unlink(missing_ok=True)
+
     def save_state(self, name: str, value: Any) -> None:
         path = self.state_path(name)
         path.parent.mkdir(parents=True, exist_ok=True)
         tmp = path.with_suffix(path.suffix + ".tmp")
-        tmp.write_text(json.dumps(_scrub_sensitive(value), ensure_ascii=True, indent=2), encoding="utf-8")
+        tmp.write_bytes(dumps_json(_scrub_sensitive(value), indent=True))
         os.replace(tmp, path)
 
 
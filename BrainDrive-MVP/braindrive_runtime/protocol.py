@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import uuid
+import os
+import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from urllib import error, request
 
 from .constants import (
@@ -10,11 +11,67 @@ from .constants import (
     PROTOCOL_VERSION,
 )
 
+try:  # pragma: no cover - depends on optional orjson install
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 Message = Dict[str, Any]
 
 
+def dumps_json(value: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 if indent else orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(value, option=option)
+    import json
+
+    # Same output as orjson: non-ASCII text stays raw UTF-8 instead of \uXXXX escapes.
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def loads_json(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+
+    return json.loads(raw)
+
+
+def get_dict(container: Dict[str, Any], key: str) -> Dict[str, Any]:
+    value = container.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+# Random bytes for new_uuid are drawn from os.urandom in blocks and handed
+# out 16 at a time, so most IDs cost no syscall. The pool is per thread and
+# dropped in forked children so processes never share pending bytes.
+_UUID_POOL_BYTES = 4096
+_uuid_pool = threading.local()
+
+
+def _reset_uuid_pool() -> None:
+    global _uuid_pool
+    _uuid_pool = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
 def new_uuid() -> str:
-    return str(uuid.uuid4())
+    pool = _uuid_pool
+    buf = getattr(pool, "buf", b"")
+    offset = getattr(pool, "offset", 0)
+    if offset + 16 > len(buf):
+        buf = pool.buf = os.urandom(_UUID_POOL_BYTES)
+        offset = 0
+    pool.offset = offset + 16
+
+    raw = bytearray(buf[offset : offset + 16])
+    raw[6] = raw[6] & 0x0F | 0x40  # version 4
+    raw[8] = raw[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def now_iso() -> str:
@@ -116,16 +173,19 @@ def validate_core(message: Any) -> Optional[Message]:
     return None
 
 
+def normalize_message(message: Message) -> Tuple[Any, Optional[Dict[str, Any]], Any]:
+    payload = message.get("payload", {})
+    return message.get("intent"), payload if isinstance(payload, dict) else None, message.get("message_id")
+
+
 def looks_like_bdp(message: Any) -> bool:
     return validate_core(message) is None
 
 
 def _decode_json(raw: bytes, url: str) -> Dict[str, Any]:
-    import json
-
     try:
-        parsed = json.loads(raw.decode("utf-8"))
-    except json.JSONDecodeError as exc:
+        parsed = loads_json(raw)
+    except ValueError as exc:
         raise RuntimeError(f"Invalid JSON response from {url}") from exc
 
     if not isinstance(parsed, dict):
@@ -134,9 +194,7 @@ def _decode_json(raw: bytes, url: str) -> Dict[str, Any]:
 
 
 def http_post_json(url: str, payload: Dict[str, Any], timeout_sec: float = 3.0) -> Dict[str, Any]:
-    import json
-
-    data = json.dumps(payload, ensure_ascii=True).encode("utf-8")
+    data = dumps_json(payload)
     req = request.Request(url=url, data=data, headers={"Content-Type": "application/json"}, method="POST")
 
     try:
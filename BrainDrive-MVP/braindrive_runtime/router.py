@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import sys
 import time
 from copy import deepcopy
 from pathlib import Path
@@ -24,6 +26,23 @@ from .protocol import ensure_trace, looks_like_bdp, make_error, validate_core
 from .protocol import http_post_json
 from .registry import NodeRecord, NodeRegistry
 
+# Response intents after which the workflow state's active folder has changed.
+_ACTIVE_FOLDER_RESPONSES = frozenset({"folder.created", "folder.switched"})
+
+
+def _collect_file_stats(directory: str, prefix: str, items: List[Tuple[str, int, int]]) -> None:
+    # One scandir pass per directory; like rglob, symlinked directories are not descended.
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    _collect_file_stats(entry.path, f"{prefix}{entry.name}/", items)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    items.append((prefix + entry.name, stat.st_size, stat.st_mtime_ns))
+    except PermissionError:
+        return
+
 
 class RouterCore:
     def __init__(
@@ -44,6 +63,8 @@ class RouterCore:
             registration_token=registration_token,
             heartbeat_ttl_sec=heartbeat_ttl_sec,
         )
+        # Bumped on every routed folder create/switch so active-folder caches know to re-probe.
+        self.active_folder_epoch = 0
 
     def register_node(self, descriptor: NodeDescriptor, handler: Any) -> Dict[str, Any]:
         result = self.registry.register(descriptor, handler)
@@ -86,14 +107,9 @@ class RouterCore:
     def _fingerprint_library(self) -> Optional[Tuple[Tuple[str, int, int], ...]]:
         if self.library_root is None or not self.library_root.exists():
             return None
-        root = self.library_root.resolve()
         items: List[Tuple[str, int, int]] = []
-        for path in sorted(root.rglob("*")):
-            if not path.is_file():
-                continue
-            rel = str(path.resolve().relative_to(root)).replace("\\", "/")
-            stat = path.stat()
-            items.append((rel, int(stat.st_size), int(stat.st_mtime_ns)))
+        _collect_file_stats(str(self.library_root), "", items)
+        items.sort()
         return tuple(items)
 
     def _check_confirmation(self, message: Dict[str, Any], approval_required: bool) -> Optional[Dict[str, Any]]:
@@ -163,7 +179,9 @@ class RouterCore:
 
         msg_id = message.get("message_id")
         protocol_version = message.get("protocol_version")
-        intent = message.get("intent")
+        # Capability names are interned at registration, so interning the
+        # inbound intent lets every name comparison hit the identity fast path.
+        intent = sys.intern(message["intent"])
         extensions = message.get("extensions", {}) or {}
 
         if protocol_version != PROTOCOL_VERSION:
@@ -212,6 +230,7 @@ class RouterCore:
         retryable_errors: List[Dict[str, Any]] = []
         for rec in eligible:
             outbound = deepcopy(message)
+            outbound["intent"] = intent
             ensure_trace(outbound, parent_message_id=msg_id, hop="router.core")
             if provider_disclosure:
                 out_ext = outbound.setdefault("extensions", {})
@@ -287,6 +306,8 @@ class RouterCore:
                     return response
 
                 self.registry.update_health(rec.descriptor.node_id, success=True, latency_ms=latency_ms)
+                if response.get("intent") in _ACTIVE_FOLDER_RESPONSES:
+                    self.active_folder_epoch += 1
                 return response
             except Exception as exc:
                 self.registry.update_health(rec.descriptor.node_id, success=False, latency_ms=None)
@@ -113,6 +113,10 @@ class BrainDriveRuntime:
         for item in self.nodes.values():
             self.router.heartbeat(item.descriptor.node_id, item.lease_token)
 
+    def flush(self) -> None:
+        for item in self.nodes.values():
+            item.node.flush()
+
     def route(self, message: Dict[str, Any]) -> Dict[str, Any]:
         return self.router.route(message)
 
@@ -167,7 +167,10 @@ class NodeHandler(BaseHTTPRequestHandler):
 def main() -> None:
     server = ThreadingHTTPServer(("0.0.0.0", PORT), NodeHandler)
     print(f"{DESCRIPTOR.node_id} ({NODE_KIND}) listening on :{PORT}")
-    server.serve_forever()
+    try:
+        server.serve_forever()
+    finally:
+        NODE.flush()
 
 
 if __name__ == "__main__":
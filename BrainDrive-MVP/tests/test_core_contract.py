@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import uuid
+
+from braindrive_runtime.protocol import new_uuid
+
 
 def test_rejects_missing_message_id(runtime, make_message):
     message = {
@@ -24,3 +28,12 @@ def test_accepts_valid_message_and_routes(runtime, make_message):
     response = runtime.route(make_message("chat.general", {"text": "hello"}))
     assert response["intent"] == "chat.response"
     assert response["payload"]["text"] == "hello"
+
+
+def test_message_ids_are_unique_uuid4_strings():
+    ids = [new_uuid() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    for value in ids[::97]:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert str(parsed) == value
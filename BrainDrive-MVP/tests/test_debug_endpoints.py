@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import http.client
+import json
+import threading
 from pathlib import Path
 
 from braindrive_runtime.debug_server import DebugIntentServer
@@ -36,3 +39,24 @@ def test_debug_endpoints_disabled(tmp_path: Path):
 def test_debug_server_defaults_to_loopback(runtime):
     server = DebugIntentServer(runtime)
     assert server.host == "127.0.0.1"
+
+
+def test_debug_server_reuses_connection_across_requests(runtime):
+    server = DebugIntentServer(runtime, port=0).make_server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        conn.request("GET", "/health")
+        health = conn.getresponse()
+        assert health.status == 200
+        assert json.loads(health.read())["ok"] is True
+
+        conn.request("POST", "/intent/analyze", body=json.dumps({"message": "list folders"}))
+        analyze = conn.getresponse()
+        assert analyze.status == 200
+        assert json.loads(analyze.read())["analysis"]["canonical_intent"] == "folder.list"
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
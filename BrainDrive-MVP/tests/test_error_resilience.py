@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from braindrive_runtime.config import ConfigResolver
 from braindrive_runtime.protocol import new_uuid
 from braindrive_runtime.runtime import BrainDriveRuntime
 
@@ -74,6 +75,23 @@ def test_provider_timeout_is_retryable(runtime_ollama_default, make_message):
     assert response["payload"]["error"]["retryable"] is True
 
 
+def test_simulated_timeout_is_ignored_without_test_endpoints(tmp_path: Path):
+    runtime = BrainDriveRuntime(
+        library_root=tmp_path / "library",
+        data_root=tmp_path / "runtime-data",
+        env={
+            "BRAINDRIVE_ENABLE_TEST_ENDPOINTS": "false",
+            "BRAINDRIVE_DEFAULT_PROVIDER": "ollama",
+            "BRAINDRIVE_OLLAMA_BASE_URL": "http://localhost:11434/v1",
+            "BRAINDRIVE_OLLAMA_DEFAULT_MODEL": "llama3:8b",
+        },
+    )
+    runtime.bootstrap()
+
+    response = runtime.route(_msg("model.chat.complete", {"prompt": "hello", "simulate_timeout": True}))
+    assert response["intent"] == "model.chat.completed"
+
+
 def test_ollama_optional_api_key_can_be_empty(runtime_ollama_default, make_message):
     response = runtime_ollama_default.route(make_message("model.chat.complete", {"prompt": "hello"}))
     assert response["intent"] == "model.chat.completed"
@@ -126,12 +144,38 @@ llm:
     assert override_route["payload"]["provider"] == "openrouter"
 
 
+def test_user_config_edits_are_picked_up_by_new_resolvers(tmp_path: Path):
+    user_config = tmp_path / "user-config.yaml"
+    user_config.write_text("llm:\n  default_provider: ollama\n", encoding="utf-8")
+    env = {"BRAINDRIVE_DEFAULT_PROVIDER": "ollama"}
+
+    first = ConfigResolver(env=env, user_config_path=user_config)
+    assert first.default_provider() == ("ollama", "user config")
+    assert ConfigResolver(env=env, user_config_path=user_config).user_config == first.user_config
+    first.user_config["llm"]["default_provider"] = "mutated"
+    assert ConfigResolver(env=env, user_config_path=user_config).default_provider() == ("ollama", "user config")
+
+    user_config.write_text("llm:\n  default_provider: openrouter\n", encoding="utf-8")
+    second = ConfigResolver(env=env, user_config_path=user_config)
+    assert second.default_provider() == ("openrouter", "user config")
+
+
 def test_missing_confirmation_returns_confirmation_error(runtime, make_message):
     response = runtime.route(make_message("memory.delete.propose", {"path": "missing.md"}))
     assert response["intent"] == "error"
     assert response["payload"]["error"]["code"] == "E_CONFIRMATION_REQUIRED"
 
 
+def test_switch_to_missing_folder_lists_available_folders(runtime, make_message):
+    (runtime.library_root / "finances").mkdir()
+    (runtime.library_root / "notes.md").write_text("not a folder", encoding="utf-8")
+
+    missing = runtime.route(make_message("folder.switch", {"folder": "notes.md"}))
+    assert missing["payload"]["error"]["code"] == "E_NODE_ERROR"
+    assert "finances" in missing["payload"]["error"]["details"]["folders"]
+    assert "notes.md" not in missing["payload"]["error"]["details"]["folders"]
+
+
 def test_provider_selection_notice_has_no_secret(runtime):
     result = runtime.bootstrap()
     notice = result["provider_notice"]
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import io
+import json
 import socket
 from urllib import error
 
 from braindrive_runtime.nodes import model_ollama, model_openrouter
+from braindrive_runtime.nodes.base import NodeContext
+from braindrive_runtime.persistence import Persistence
+
+
+class _JsonResponse(io.BytesIO):
+    def __init__(self, body) -> None:  # noqa: ANN001
+        super().__init__(json.dumps(body).encode("utf-8"))
 
 
 def test_openrouter_completion_returns_provider_text(runtime, make_message):
@@ -60,3 +68,77 @@ def test_ollama_timeout_maps_to_retryable_timeout(runtime, make_message, monkeyp
     assert response["intent"] == "error"
     assert response["payload"]["error"]["code"] == "E_NODE_TIMEOUT"
     assert response["payload"]["error"]["retryable"] is True
+
+
+def test_ollama_reuses_greedy_completions_only(runtime, make_message, monkeypatch):
+    calls = []
+    fake_urlopen = model_ollama.request.urlopen
+
+    def _counting(req, timeout=0):  # noqa: ANN001
+        calls.append(req.full_url)
+        return fake_urlopen(req, timeout=timeout)
+
+    monkeypatch.setattr(model_ollama.request, "urlopen", _counting)
+
+    for temperature in (0, 0, 0.7, 0.7):
+        response = runtime.route(
+            make_message(
+                "model.chat.complete",
+                {"prompt": "hello"},
+                {"llm": {"provider": "ollama", "model": "llama3:8b", "temperature": temperature}},
+            )
+        )
+        assert response["payload"]["text"] == "mock-response:llama3:8b:hello"
+
+    assert len(calls) == 3
+
+
+def test_ollama_catalog_is_reused_until_refresh(runtime, make_message, monkeypatch):
+    calls = []
+    fake_urlopen = model_ollama.request.urlopen
+
+    def _counting(req, timeout=0):  # noqa: ANN001
+        calls.append(req.full_url)
+        return fake_urlopen(req, timeout=timeout)
+
+    monkeypatch.setattr(model_ollama.request, "urlopen", _counting)
+
+    for payload in ({}, {}, {"refresh": True}):
+        response = runtime.route(make_message("model.catalog.list", payload, {"llm": {"provider": "ollama", "model": "llama3:8b"}}))
+        assert response["intent"] == "model.catalog"
+        assert response["payload"]["fallback"] is False
+
+    assert len(calls) == 2
+
+
+def test_ollama_semantic_cache_reuses_near_duplicate_prompts(tmp_path, make_message, monkeypatch):
+    vectors = {"about philadelphia": [1.0, 0.0], "on philadelphia": [0.99, 0.1], "bake bread": [0.0, 1.0]}
+    completions = []
+
+    def _fake_urlopen(req, timeout=0):  # noqa: ANN001
+        body = json.loads(req.data.decode("utf-8"))
+        if req.full_url.endswith("/embeddings"):
+            return _JsonResponse({"data": [{"embedding": vectors[body["input"]]}]})
+        prompt = body["messages"][0]["content"]
+        completions.append(prompt)
+        return _JsonResponse({"choices": [{"message": {"content": f"answer:{prompt}"}}]})
+
+    monkeypatch.setattr(model_ollama.request, "urlopen", _fake_urlopen)
+    node = model_ollama.OllamaModelNode(
+        NodeContext(
+            library_root=tmp_path,
+            persistence=Persistence(tmp_path / "runtime"),
+            registration_token="token",
+            env={"BRAINDRIVE_OLLAMA_BASE_URL": "http://ollama.test/v1", "BRAINDRIVE_OLLAMA_SEMCACHE": "true"},
+        )
+    )
+
+    texts = [
+        node.handle(
+            make_message("model.chat.complete", {"prompt": prompt}, {"llm": {"model": "llama3:8b", "temperature": 0}})
+        )["payload"]["text"]
+        for prompt in ("about philadelphia", "on philadelphia", "bake bread")
+    ]
+
+    assert texts == ["answer:about philadelphia", "answer:about philadelphia", "answer:bake bread"]
+    assert completions == ["about philadelphia", "bake bread"]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
+import threading
 from pathlib import Path
 
+from braindrive_runtime.nodes import approval_gate
 from braindrive_runtime.protocol import new_uuid
 from braindrive_runtime.runtime import BrainDriveRuntime
 
@@ -133,3 +136,74 @@ def test_ad_hoc_chat_text_is_not_persisted(tmp_path: Path):
             continue
         content = path.read_text(encoding="utf-8", errors="replace")
         assert marker not in content
+
+
+def test_audit_records_are_written_before_the_reply(tmp_path: Path):
+    data = tmp_path / "runtime-data"
+    runtime = _runtime(tmp_path / "library", data)
+    audit_log = data / "logs" / "audit.jsonl"
+
+    for step in (1, 2):
+        assert runtime.route(_msg("audit.record", {"step": step}))["intent"] == "audit.recorded"
+        lines = [json.loads(line) for line in audit_log.read_text(encoding="utf-8").splitlines()]
+        assert [line["payload"]["step"] for line in lines] == list(range(1, step + 1))
+
+
+def test_concurrent_audit_records_are_all_written_in_order(tmp_path: Path):
+    data = tmp_path / "runtime-data"
+    node = _runtime(tmp_path / "library", data).nodes["node.audit.log"].node
+
+    def _record(worker):
+        for step in range(25):
+            node.handle(_msg("audit.record", {"worker": worker, "step": step}))
+
+    threads = [threading.Thread(target=_record, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = [json.loads(line) for line in (data / "logs" / "audit.jsonl").read_text(encoding="utf-8").splitlines()]
+    for worker in range(8):
+        assert [line["payload"]["step"] for line in lines if line["payload"]["worker"] == worker] == list(range(25))
+
+
+def test_approval_requests_survive_restart_via_journal(tmp_path: Path):
+    library = tmp_path / "library"
+    data = tmp_path / "runtime-data"
+
+    first = _runtime(library, data)
+    requested = first.route(
+        _msg("approval.request", {"intent_being_guarded": "memory.write", "changes": [{"path": "a.md"}]})
+    )
+    request_id = requested["payload"]["request_id"]
+    assert (data / "state" / "approvals.journal.jsonl").exists()
+
+    second = _runtime(library, data)
+    assert not (data / "state" / "approvals.journal.jsonl").exists()
+    resolved = second.route(_msg("approval.resolve", {"request_id": request_id, "decision": "approved"}))
+    assert resolved["intent"] == "approval.resolved"
+    assert resolved["payload"]["changes"] == [{"path": "a.md"}]
+
+    third = _runtime(library, data)
+    assert third.nodes["node.approval.gate"].node.state["requests"][request_id]["status"] == "approved"
+
+
+def test_approval_journal_is_compacted_while_running(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(approval_gate, "_JOURNAL_COMPACT_EVERY", 3)
+    library = tmp_path / "library"
+    data = tmp_path / "runtime-data"
+    journal = data / "state" / "approvals.journal.jsonl"
+
+    runtime = _runtime(library, data)
+    request_ids = []
+    for index in range(4):
+        requested = runtime.route(
+            _msg("approval.request", {"intent_being_guarded": "memory.write", "changes": [{"path": f"{index}.md"}]})
+        )
+        request_ids.append(requested["payload"]["request_id"])
+        assert journal.exists() is (index != 2)
+
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 1
+    restarted = _runtime(library, data)
+    assert sorted(restarted.nodes["node.approval.gate"].node.state["requests"]) == sorted(request_ids)
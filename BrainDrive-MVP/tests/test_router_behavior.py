@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from typing import Any, Dict
 
+from braindrive_runtime.intent_router import _KEYWORD_GROUPS
 from braindrive_runtime.metadata import CapabilityMetadata, NodeDescriptor
 from braindrive_runtime.protocol import make_response, new_uuid
 
@@ -194,6 +197,60 @@ def test_list_my_folders_routes_to_folder_list(runtime):
     assert routed["route_response"]["intent"] == "folder.listed"
 
 
+def test_folder_list_reflects_folders_added_after_a_listing(runtime):
+    runtime.route_nl("list my folders")
+    runtime.route_nl("create folder quarters", confirm=True)
+    (runtime.library_root / "pennies").mkdir()
+
+    listed = runtime.route_nl("list my folders")["route_response"]["payload"]["folders"]
+    assert "quarters" in listed
+    assert "pennies" in listed
+
+
+def test_memory_search_reflects_files_changed_after_a_search(runtime, make_message):
+    runtime.library_root.mkdir(parents=True, exist_ok=True)
+    note = runtime.library_root / "note.md"
+    note.write_text("quarterly budget\n", encoding="utf-8")
+
+    first = runtime.route(make_message("memory.search", {"query": "budget"}))
+    assert [match["path"] for match in first["payload"]["matches"]] == ["note.md"]
+
+    note.write_text("nothing relevant here\n", encoding="utf-8")
+    (runtime.library_root / "plan.md").write_text("budget review\n", encoding="utf-8")
+
+    second = runtime.route(make_message("memory.search", {"query": "budget"}))
+    assert [match["path"] for match in second["payload"]["matches"]] == ["plan.md"]
+
+
+def test_memory_search_cache_hit_survives_concurrent_write(runtime, make_message):
+    node = runtime.nodes["node.memory.fs"].node
+    (runtime.library_root / "notes.md").write_text("budget notes\n", encoding="utf-8")
+    search = make_message("memory.search", {"query": "budget"})
+    first = node.handle(search)
+    assert first["payload"]["matches"]
+
+    write = make_message(
+        "memory.write.propose",
+        {"path": "other.md", "content": "unrelated\n"},
+        {"confirmation": {"required": True, "status": "approved", "request_id": "appr-other"}},
+    )
+    writes = []
+    writer = threading.Thread(target=lambda: writes.append(node.handle(write)))
+
+    class _WriteDuringLookup(OrderedDict):
+        def get(self, key, default=None):  # noqa: ANN001
+            value = super().get(key, default)
+            if not writer.is_alive() and not writes:
+                writer.start()
+                writer.join(0.2)  # gives an unlocked write time to clear the cache
+            return value
+
+    node._search_cache = _WriteDuringLookup(node._search_cache)
+    assert node.handle(search)["payload"]["matches"] == first["payload"]["matches"]
+    writer.join()
+    assert writes[0]["intent"] == "memory.write.applied"
+
+
 def test_list_files_scopes_to_active_folder(runtime):
     created = runtime.route_nl("create folder dimes", confirm=True)
     assert created["status"] == "routed"
@@ -210,6 +267,35 @@ def test_list_files_scopes_to_active_folder(runtime):
     assert routed["route_response"]["intent"] == "memory.listed"
 
 
+def test_list_files_scope_follows_folder_switch_after_cached_probe(runtime):
+    before = runtime.route_nl("list files")
+    assert before["analysis"]["payload"]["path"] == "."
+
+    runtime.route_nl("create folder nickels", confirm=True)
+    runtime.route_nl("switch folder to nickels")
+
+    after = runtime.route_nl("list files")
+    assert after["analysis"]["payload"]["path"] == "nickels"
+
+
+def test_list_files_scope_follows_folder_switch_routed_directly(runtime, make_message):
+    for folder in ("alpha", "beta"):
+        created = runtime.route(
+            make_message(
+                "folder.create",
+                {"topic": folder},
+                {"confirmation": {"required": True, "status": "approved", "request_id": f"appr-{folder}"}},
+            )
+        )
+        assert created["intent"] == "folder.created"
+
+    runtime.route(make_message("folder.switch", {"folder": "alpha"}))
+    assert runtime.analyze("list files")["payload"] == {"path": "alpha"}
+
+    runtime.route(make_message("folder.switch", {"folder": "beta"}))
+    assert runtime.analyze("list files")["payload"] == {"path": "beta"}
+
+
 def test_plain_text_routes_to_interview_continue_when_context_awaiting_answer(runtime):
     created = runtime.route_nl("create folder dimes", confirm=True)
     assert created["status"] == "routed"
@@ -243,3 +329,18 @@ def test_create_folder_parses_quoted_topic(runtime):
     analyzed = runtime.analyze('create folder "Pennies"')
     assert analyzed["canonical_intent"] == "folder.create"
     assert analyzed["payload"]["topic"] == "Pennies"
+
+
+def test_keyword_priority_follows_intent_order_not_text_position(runtime):
+    analyzed = runtime.analyze("complete interview me")
+    assert analyzed["canonical_intent"] == "workflow.interview.start"
+
+    analyzed = runtime.analyze("stream response and save plan")
+    assert analyzed["canonical_intent"] == "workflow.plan.propose_save"
+
+
+def test_every_intent_keyword_passes_the_trigger_prefilter(runtime):
+    for _group, tokens in _KEYWORD_GROUPS:
+        for token in tokens:
+            analyzed = runtime.analyze(token)
+            assert analyzed["reason_codes"][0] != "fallback_model_chat", token
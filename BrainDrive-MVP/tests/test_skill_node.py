@@ -37,6 +37,47 @@ def test_skill_catalog_and_legacy_capability_mapping(runtime, make_message):
     assert "node.workflow.plan" not in all_node_ids
 
 
+def test_skill_catalog_tracks_manifest_and_legacy_edits(runtime, make_message):
+    skills_dir = runtime.library_root / ".braindrive" / "skills"
+
+    def _actions(skill_id):
+        response = runtime.route(make_message("skill.catalog.list", {}))
+        by_skill = {item["skill_id"]: item for item in response["payload"]["skills"]}
+        return by_skill[skill_id]["actions"]
+
+    (skills_dir / "review").mkdir()
+    manifest = skills_dir / "review" / "skill.yaml"
+    manifest.write_text("skill_id: review\nactions:\n  check:\n    execution_tier: read\n", encoding="utf-8")
+    legacy = skills_dir / "review.md"
+    legacy.write_text("# Review\n", encoding="utf-8")
+    assert _actions("review") == ["check", "run"]
+
+    legacy.unlink()
+    assert _actions("review") == ["check"]
+
+    manifest.write_text("skill_id: review\nactions:\n  summarize:\n    execution_tier: read\n", encoding="utf-8")
+    assert _actions("review") == ["summarize"]
+
+
+def test_skill_resolution_sees_manifest_and_legacy_edits(runtime, make_message):
+    skills_dir = runtime.library_root / ".braindrive" / "skills"
+
+    def _execute(action):
+        return runtime.route(make_message("skill.execute.read", {"skill_id": "review", "action": action}))
+
+    (skills_dir / "review").mkdir()
+    manifest = skills_dir / "review" / "skill.yaml"
+    manifest.write_text("skill_id: review\nactions:\n  check:\n    execution_tier: read\n", encoding="utf-8")
+    assert _execute("check")["payload"]["error"]["message"] == "Skill prompt not found: review.md"
+    assert _execute("summarize")["payload"]["error"]["message"] == "Unknown action 'summarize' for skill 'review'"
+
+    manifest.write_text("skill_id: review\nactions:\n  summarize:\n    execution_tier: read\n", encoding="utf-8")
+    assert _execute("summarize")["payload"]["error"]["message"] == "Skill prompt not found: review.md"
+
+    (skills_dir / "review.md").write_text("# Review\n", encoding="utf-8")
+    assert _execute("run")["intent"] == "skill.executed"
+
+
 def test_skill_execute_stateful_interview_start(runtime, make_message):
     _create_and_switch(runtime, make_message)
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from braindrive_runtime.nodes import folder
 from braindrive_runtime.runtime import BrainDriveRuntime
 
 
@@ -110,3 +111,36 @@ def test_what_next_uses_plan_context(runtime, make_message):
     assert response["intent"] == "chat.response"
     assert response["payload"]["source"] == "finances/plan.md"
     assert "Review spending baseline" in " ".join(response["payload"]["next_steps"])
+
+
+def test_what_next_reflects_plan_edits(runtime, make_message):
+    _create_and_switch(runtime)
+    plan_path = runtime.library_root / "finances" / "plan.md"
+    plan_path.write_text("# Finances Plan\n\n- Review spending baseline\n", encoding="utf-8")
+    first = runtime.route(make_message("chat.general", {"text": "what next"}))
+    assert first["payload"]["next_steps"] == ["- Review spending baseline"]
+
+    plan_path.write_text("# Finances Plan\n\n  - Open a savings account  \n", encoding="utf-8")
+    second = runtime.route(make_message("chat.general", {"text": "what next"}))
+    assert second["payload"]["next_steps"] == ["- Open a savings account"]
+
+
+def test_what_next_is_found_anywhere_in_a_long_message(runtime, make_message):
+    _create_and_switch(runtime)
+    (runtime.library_root / "finances" / "plan.md").write_text("# Finances Plan\n\n- Review spending baseline\n", encoding="utf-8")
+
+    response = runtime.route(make_message("chat.general", {"text": "context " * 100 + "so what next?"}))
+    assert response["payload"]["next_steps"] == ["- Review spending baseline"]
+
+
+def test_folder_switch_reports_truncated_context_docs(runtime, make_message, monkeypatch):
+    monkeypatch.setattr(folder, "_CONTEXT_DOC_MAX_CHARS", 16)
+    _create_and_switch(runtime)
+    (runtime.library_root / "finances" / "plan.md").write_text("- step\n" * 10, encoding="utf-8")
+    (runtime.library_root / "finances" / "spec.md").write_text("short spec\n", encoding="utf-8")
+
+    switched = runtime.route(make_message("folder.switch", {"folder": "finances"}))
+    payload = switched["payload"]
+    assert payload["context_docs"]["plan.md"] == "- step\n- step\n- "
+    assert payload["context_docs"]["spec.md"] == "short spec\n"
+    assert payload["context_docs_truncated"] == ["AGENT.md", "plan.md"]